@@ -0,0 +1,39 @@
+"""
+Time the construction of form instances for forms of 10, 100 and 1,000
+fields, reporting the cost per instance.
+
+    uv run python benchmarks/construction.py
+"""
+import timeit
+
+from textual.validation import Number
+
+from textual_forms.form import Form
+from textual_forms.field import StringField, IntegerField, ChoiceField
+from textual_forms.validators import Palindromic
+
+SIZES = (10, 100, 1000)
+
+
+def form_class(n):
+    attrs = {}
+    for i in range(n):
+        if i % 3 == 0:
+            attrs[f"f{i}"] = StringField(placeholder=f"Field {i}", validators=[Palindromic()])
+        elif i % 3 == 1:
+            attrs[f"f{i}"] = IntegerField(validators=[Number(minimum=0, maximum=130)])
+        else:
+            attrs[f"f{i}"] = ChoiceField(choices=[(str(c), f"Choice {c}") for c in range(20)])
+    return type(f"Form{n}", (Form,), attrs)
+
+
+def main():
+    for n in SIZES:
+        cls = form_class(n)
+        number = max(10, 10_000 // n)
+        seconds = min(timeit.repeat(cls, number=number, repeat=5)) / number
+        print(f"{n:>5} fields: {seconds * 1e6:10.1f} µs per instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Headless benchmarks for form construction, rendering, data handling and
+validation.
+
+The time to import textual_forms is measured first, in fresh
+interpreters, as the "import" phase of the "startup" results. Then
+synthetic Form subclasses are generated with N fields of each supported
+type, and each phase is timed (best of several runs) for every size:
+
+    class       creating the Form subclass
+    instance    instantiating it
+    render      BaseForm.render(), which creates the widgets
+    mount       running the app under run_test until the form is mounted
+    set_data    loading a full record into the mounted form, including
+                handling any messages that triggers
+    get_data    reading a full record back out
+    validate    validating every field after all the values have changed
+    coerce      converting a batch of records to the class's record type
+
+Results are compared with the stored baselines in baseline.json and any
+phase slower than its baseline by more than the tolerance is reported as
+a regression.
+
+    uv run python benchmarks/suite.py                 # compare with baselines
+    uv run python benchmarks/suite.py --check         # ... failing on regressions
+    uv run python benchmarks/suite.py --save          # record new baselines
+    uv run python benchmarks/suite.py --sizes 10 100
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from textual.app import App
+from textual.validation import Number
+
+from textual_forms.form import Form
+from textual_forms.field import StringField, IntegerField, TextField, BooleanField, ChoiceField
+from textual_forms.validators import Palindromic
+
+BASELINE = Path(__file__).with_name("baseline.json")
+SIZES = (10, 50, 200)
+REPEAT = 3
+TOLERANCE = 0.25
+CHOICES = [("a", "A"), ("b", "B"), ("c", "C")]
+BATCH = 100
+
+
+def field_attrs(n):
+    """
+    Declarations of n fields of each type, with validators where supported.
+    """
+    attrs = {}
+    for i in range(n):
+        attrs[f"s{i}"] = StringField(validators=[Palindromic()])
+        attrs[f"i{i}"] = IntegerField(validators=[Number(minimum=0, maximum=1_000_000)])
+        attrs[f"t{i}"] = TextField()
+        attrs[f"b{i}"] = BooleanField(label=f"Flag {i}")
+        attrs[f"c{i}"] = ChoiceField(choices=CHOICES)
+    return attrs
+
+
+def form_class(n):
+    return type(f"Bench{n}Form", (Form,), field_attrs(n))
+
+
+def record(n, variant=0):
+    data = {}
+    for i in range(n):
+        data[f"s{i}"] = "abba" if variant else f"abc{i}"
+        data[f"i{i}"] = i + variant
+        data[f"t{i}"] = f"Text {i}\nvariant {variant}"
+        data[f"b{i}"] = bool(variant)
+        data[f"c{i}"] = "B" if variant else "A"
+    return data
+
+
+def best(fn, repeat=REPEAT):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+IMPORT_SCRIPT = """\
+import time
+start = time.perf_counter()
+import textual_forms
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(repeat=REPEAT * 3):
+    """
+    The best time to import textual_forms in a fresh interpreter.
+    """
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT], capture_output=True, text=True, check=True
+        ).stdout
+        times.append(float(output))
+    return min(times)
+
+
+def bench_app(form):
+
+    class BenchApp(App):
+        def compose(self):
+            yield form.render(id="form-container")
+
+    return BenchApp()
+
+
+async def mounted_phases(cls, n):
+    """
+    Time mounting plus the phases that need a mounted form.
+    """
+    results = {"mount": [], "set_data": [], "get_data": [], "validate": []}
+    for run in range(REPEAT):
+        form = cls()
+        app = bench_app(form)
+        start = time.perf_counter()
+        async with app.run_test(size=(100, 50)) as pilot:
+            await pilot.pause()
+            results["mount"].append(time.perf_counter() - start)
+            data = record(n, run % 2)
+            start = time.perf_counter()
+            form.set_data(data)
+            await pilot.pause()
+            results["set_data"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            form.get_data()
+            results["get_data"].append(time.perf_counter() - start)
+            # set_data validated (and cached) every value it loaded, so load
+            # the other record unvalidated for validate to have work to do
+            form.set_data(record(n, (run + 1) % 2), validate=False)
+            await pilot.pause()
+            start = time.perf_counter()
+            form.validate()
+            results["validate"].append(time.perf_counter() - start)
+    return {phase: min(times) for phase, times in results.items()}
+
+
+def run(sizes):
+    results = {"startup": {"import": import_time()}}
+    for n in sizes:
+        attrs = field_attrs(n)
+        cls = form_class(n)
+        timings = {
+            "class": best(lambda: type("BenchForm", (Form,), dict(attrs))),
+            "instance": best(cls),
+            "render": best(lambda: cls().render(id="form-container")),
+        }
+        timings.update(asyncio.run(mounted_phases(cls, n)))
+        batch = [record(n, i % 2) for i in range(BATCH)]
+        timings["coerce"] = best(lambda: list(cls.coercer().records(batch)))
+        results[str(n)] = timings
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Print the results beside their baselines, returning the regressions.
+    """
+    regressions = []
+    print(f"{'fields':>7} {'phase':<10} {'ms':>10} {'baseline':>10} {'change':>8}")
+    for size, timings in results.items():
+        for phase, seconds in timings.items():
+            base = baseline.get(size, {}).get(phase)
+            if base:
+                change = seconds / base - 1
+                flag = " !" if change > tolerance else ""
+                if flag:
+                    regressions.append((size, phase, change))
+                print(f"{size:>7} {phase:<10} {seconds * 1e3:10.2f} {base * 1e3:10.2f} {change:+8.0%}{flag}")
+            else:
+                print(f"{size:>7} {phase:<10} {seconds * 1e3:10.2f} {'-':>10} {'-':>8}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless textual-forms benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES,
+                        help="numbers of fields of each type (default %(default)s)")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baselines")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 on any regression")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="slowdown reported as a regression (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes)
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    regressions = compare(results, baseline, args.tolerance)
+    if args.save:
+        baseline.update(results)
+        BASELINE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baselines saved to {BASELINE}")
+    elif regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 # __init__.py
 from .version import __version__
 from .form import Form
-from .field import Field, StringField, IntegerField, TextField, BooleanField, ChoiceField
\ No newline at end of file
+from .field import Field, StringField, IntegerField, TextField, LargeTextField, BooleanField, ChoiceField, LargeChoiceField
+from .formset import FormSet
\ No newline at end of file
@@ -0,0 +1,127 @@
+# bulk.py
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+Errors = Dict[str, List[str]]
+Source = Union[str, Path, Iterable[Any]]
+
+# The key under which a record's errors are reported when it can't be
+# read as a record at all.
+RECORD = "__record__"
+
+
+def read_records(path: Union[str, Path]) -> Iterator[Any]:
+    """
+    Read the records in a .csv file as dicts, or the lines of a JSONL file
+    unparsed, so that the parsing can be done alongside the validation.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    else:
+        with path.open(encoding="utf-8") as f:
+            yield from f
+
+
+def check_chunk(form_class, start: int, chunk: List[Any]) -> List[Tuple[int, Errors]]:
+    """
+    Check each record in chunk against form_class, returning the index and
+    errors of those that fail. A record may also be a line of JSON, which
+    is parsed first; blank lines are skipped.
+    """
+    results = []
+    for index, record in enumerate(chunk, start):
+        if isinstance(record, str):
+            if not record.strip():
+                continue
+            try:
+                record = json.loads(record)
+            except ValueError as e:
+                results.append((index, {RECORD: [f"Invalid JSON: {e}"]}))
+                continue
+        if not isinstance(record, dict):
+            results.append((index, {RECORD: ["Not a record"]}))
+            continue
+        errors = form_class.check_data(record)
+        if errors:
+            results.append((index, errors))
+    return results
+
+
+_worker_form_class = None
+
+def _init_worker(form_class):
+    global _worker_form_class
+    _worker_form_class = form_class
+
+def _check_chunk_in_worker(start: int, chunk: List[Any]) -> List[Tuple[int, Errors]]:
+    return check_chunk(_worker_form_class, start, chunk)
+
+
+def chunked(records: Iterable[Any], chunk_size: int) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    Split records into lists of chunk_size, with the index of each list's first record.
+    """
+    records = iter(records)
+    start = 0
+    while chunk := list(islice(records, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def bulk_validate(
+    form_class,
+    source: Source,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> Iterator[Tuple[int, Errors]]:
+    """
+    Validate every record in source against form_class with its
+    check_data method, across a pool of workers processes (by default,
+    one per CPU), yielding the index and errors of each failing record in
+    input order.
+
+    source is the path of a .csv or JSONL file, or an iterable of dicts or
+    JSON lines. It is read lazily, one chunk of chunk_size records at a
+    time, and at most two chunks per worker are in flight, so memory use
+    doesn't grow with the size of the input. form_class must be importable
+    by the worker processes, which rules out classes defined in functions.
+    With workers=0 the records are checked in this process.
+    """
+    records = read_records(source) if isinstance(source, (str, Path)) else source
+    chunks = chunked(records, chunk_size)
+    if workers == 0:
+        for start, chunk in chunks:
+            yield from check_chunk(form_class, start, chunk)
+        return
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(form_class,))
+    pending = deque()
+    try:
+        for start, chunk in chunks:
+            pending.append(pool.submit(_check_chunk_in_worker, start, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def write_report(results: Iterable[Tuple[int, Errors]], out: TextIO) -> int:
+    """
+    Write results from bulk_validate to out as JSON lines, each holding a
+    record's index and errors, returning the number of failing records.
+    """
+    count = 0
+    for index, errors in results:
+        out.write(json.dumps({"record": index, "errors": errors}) + "\n")
+        count += 1
+    return count
@@ -0,0 +1,125 @@
+# choices.py
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+Choices = Union[Iterable[Tuple[str, Any]], Callable[[], Iterable[Tuple[str, Any]]]]
+
+
+def trigrams(key: str):
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+class ChoiceIndex:
+    """
+    A search index over a large set of (label, value) choices.
+
+    The choices can be a list, an iterator or a callable returning an
+    iterable; they are read once, the first time the index is used. Labels
+    are matched case-insensitively, with labels starting with the query
+    ahead of those merely containing it. Prefix matches come from a sorted
+    key list, substring matches from a trigram index, and the matches for a
+    query that extends a recent one are found by filtering that query's
+    matches, so narrowing a search as the user types stays cheap.
+    """
+    CACHE_SIZE = 16  # recent queries whose full matches are remembered
+
+    def __init__(self, choices: Choices):
+        self._source = choices
+        self._built = False
+        self._matches: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    def _build(self):
+        source = self._source() if callable(self._source) else self._source
+        self.labels: List[str] = []
+        self.values: List[Any] = []
+        for label, value in source:
+            self.labels.append(label)
+            self.values.append(value)
+        self._source = None
+        self._keys = [label.casefold() for label in self.labels]
+        self._sorted = sorted(range(len(self._keys)), key=self._keys.__getitem__)
+        self._sorted_keys = [self._keys[i] for i in self._sorted]
+        self._trigrams: Dict[str, List[int]] = defaultdict(list)
+        for i, key in enumerate(self._keys):
+            for trigram in trigrams(key):
+                self._trigrams[trigram].append(i)
+        self._labels_by_value = dict(zip(self.values, self.labels))
+        self._built = True
+
+    def __len__(self) -> int:
+        if not self._built:
+            self._build()
+        return len(self.labels)
+
+    def __contains__(self, value: Any) -> bool:
+        if not self._built:
+            self._build()
+        return value in self._labels_by_value
+
+    def label(self, value: Any) -> Optional[str]:
+        if not self._built:
+            self._build()
+        return self._labels_by_value.get(value)
+
+    def prefix_matches(self, query: str, limit: int) -> List[int]:
+        """
+        The indexes of up to limit choices whose labels start with query,
+        in label order.
+        """
+        if not self._built:
+            self._build()
+        key = query.casefold()
+        result = []
+        position = bisect_left(self._sorted_keys, key)
+        while position < len(self._sorted_keys) and len(result) < limit:
+            if not self._sorted_keys[position].startswith(key):
+                break
+            result.append(self._sorted[position])
+            position += 1
+        return result
+
+    def matches(self, query: str) -> List[int]:
+        """
+        The indexes of all choices whose labels contain query, in their
+        original order.
+        """
+        if not self._built:
+            self._build()
+        key = query.casefold()
+        if key in self._matches:
+            self._matches.move_to_end(key)
+            return self._matches[key]
+        narrower = [q for q in self._matches if q in key]
+        if narrower:
+            candidates = self._matches[max(narrower, key=len)]
+        elif len(key) >= 3:
+            candidates = min((self._trigrams.get(t, []) for t in trigrams(key)), key=len)
+        else:
+            candidates = range(len(self._keys))
+        keys = self._keys
+        result = [i for i in candidates if key in keys[i]]
+        self._matches[key] = result
+        if len(self._matches) > self.CACHE_SIZE:
+            self._matches.popitem(last=False)
+        return result
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, Any]]:
+        """
+        Up to limit (label, value) choices matching query, prefix matches
+        first.
+        """
+        if not self._built:
+            self._build()
+        if not query:
+            found = range(min(limit, len(self.labels)))
+        else:
+            found = self.prefix_matches(query, limit)
+            if len(found) < limit:
+                seen = set(found)
+                for i in self.matches(query):
+                    if i not in seen:
+                        found.append(i)
+                        if len(found) == limit:
+                            break
+        return [(self.labels[i], self.values[i]) for i in found]
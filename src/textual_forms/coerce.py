@@ -0,0 +1,116 @@
+# coerce.py
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Union
+
+
+class CoercionError(ValueError):
+    """
+    Data couldn't be converted to a form's Python values. errors holds the
+    failure messages of each field that failed, and index the position of
+    the failing record when converting a batch.
+    """
+    def __init__(self, errors: Dict[str, List[str]], index: Optional[int] = None):
+        self.errors = errors
+        self.index = index
+        failures = "; ".join(f"{name}: {' '.join(messages)}" for name, messages in errors.items())
+        super().__init__(failures if index is None else f"Record {index}: {failures}")
+
+
+class Coercer:
+    """
+    Converts the data of one form class to typed Python values, or to
+    instances of a NamedTuple record type generated for the class, and
+    back to the values its widgets hold.
+
+    Each field's converter and to_widget_value are looked up once, when
+    the coercer is built, so converting a record is a single pass over
+    functions already chosen for each field. A form class builds its
+    coercer the first time it is needed (see BaseForm.coercer).
+
+    Conversion checks that required values are present and coerces them to
+    their types, but doesn't run validators; use check_data for that.
+    Fields that the data's values would hide are left out, as None.
+
+    Records pickle as their form class and values, so they can be
+    unpickled wherever the form class can be imported.
+    """
+
+    def __init__(self, form_class):
+        fields = form_class._schema.fields
+        for name in fields:
+            if name.startswith("_"):
+                raise ValueError(
+                    f"{form_class.__name__}.{name}: a field whose name starts with an underscore can't be a record field"
+                )
+        self.names = tuple(fields)
+        self.record_type = NamedTuple(
+            f"{form_class.__name__}Record",
+            [(name, Optional[field.python_type]) for name, field in fields.items()],
+        )
+        self.record_type.__reduce__ = lambda record: (_make_record, (form_class, tuple(record)))
+        self._hidden_names = form_class.hidden_names if form_class._schema.conditional else None
+        self._converters = tuple((name, field.converter()) for name, field in fields.items())
+        self._serialisers = tuple((name, field.to_widget_value) for name, field in fields.items())
+
+    def to_python(self, data: Mapping[str, Any], hidden: Optional[Collection[str]] = None) -> Dict[str, Any]:
+        """
+        The Python values of data, a dict of data or widget values (a
+        missing value counts as empty), raising CoercionError when any
+        can't be converted. The fields named in hidden (by default, those
+        the data's values would hide) are None.
+        """
+        if hidden is None:
+            hidden = self._hidden_names(data) if self._hidden_names is not None else ()
+        get = data.get
+        values: Dict[str, Any] = {}
+        errors: Optional[Dict[str, List[str]]] = None
+        for name, convert in self._converters:
+            if name in hidden:
+                values[name] = None
+                continue
+            try:
+                values[name] = convert(get(name))
+            except (TypeError, ValueError) as e:
+                if errors is None:
+                    errors = {}
+                errors[name] = [str(e)]
+        if errors:
+            raise CoercionError(errors)
+        return values
+
+    def record(self, data: Mapping[str, Any], hidden: Optional[Collection[str]] = None):
+        """
+        data converted to an instance of record_type.
+        """
+        return self.record_type._make(self.to_python(data, hidden).values())
+
+    def records(self, records: Iterable[Mapping[str, Any]]) -> Iterator[Any]:
+        """
+        Lazily convert each of records to an instance of record_type. A
+        record that can't be converted raises CoercionError, with its index.
+        """
+        record = self.record
+        for index, data in enumerate(records):
+            try:
+                yield record(data)
+            except CoercionError as e:
+                raise CoercionError(e.errors, index) from None
+
+    def as_dict(self, record) -> Dict[str, Any]:
+        """
+        The values of an instance of record_type, by field name.
+        """
+        return dict(zip(self.names, record))
+
+    def to_widget_values(self, data: Union[Mapping[str, Any], Any]) -> Dict[str, Any]:
+        """
+        The values the fields' widgets would hold for data, a dict of
+        Python values or an instance of record_type.
+        """
+        if isinstance(data, self.record_type):
+            data = self.as_dict(data)
+        get = data.get
+        return {name: to_widget_value(get(name)) for name, to_widget_value in self._serialisers}
+
+
+def _make_record(form_class, values):
+    return form_class.coercer().record_type._make(values)
@@ -1,10 +1,62 @@
 # field.py
-from typing import Any, Callable, List, Optional
+import asyncio
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+from textual.validation import ValidationResult
+
+from .choices import ChoiceIndex, Choices
+from .instrument import instrumentation
+from .validators import AsyncValidator, LineValidator, ThreadedValidator, failure_messages
+
+# Widget classes are imported by the methods that need them, so that forms
+# can be declared and their data validated without importing any widgets.
+
+REQUIRED = "A value is required"
+
+
+def string_converter(required: bool) -> Callable[[Any], Any]:
+    """
+    The converter of a field whose values are plain strings.
+    """
+    def convert(value):
+        if value is None or value == "":
+            if required:
+                raise ValueError(REQUIRED)
+            return None
+        return value if type(value) is str else str(value)
+    return convert
+
+class _Unset:
+    """No value has been remembered while the field had no widget."""
+    def __deepcopy__(self, memo):
+        return self
+
+_UNSET = _Unset()
+
+
+class Condition:
+    """
+    When a field should be shown, for Field(show_if=...): function is
+    passed the values of the fields named in fields as keyword arguments,
+    and returns whether to show the field. A condition is false while any
+    of its fields is itself hidden, or holds a value function can't handle.
+    """
+    def __init__(self, fields: Sequence[str], function: Callable[..., bool]):
+        self.fields = tuple(fields)
+        self.function = function
+
+    def evaluate(self, values: Dict[str, Any]) -> bool:
+        try:
+            return bool(self.function(**values))
+        except (TypeError, ValueError):
+            return False
 
-from .widget import StringWidget, IntegerWidget, CheckboxWidget, SelectWidget, TextWidget
 
 class Field:
 
+    widget_shows_label = False  # Does the widget display the field's label itself?
+    python_type: Any = str  # The type of the field's Python values
+
     def __init__(
         self,
         label: str = "",
@@ -13,6 +65,8 @@ class Field:
         help_text: str = "",
         disabled=False,
         widget=None,
+        validation_delay: float = 0.0,
+        show_if: Union[str, Condition, None] = None,
         **kwargs,
     ):
         self.kwargs = kwargs
@@ -24,63 +78,513 @@ class Field:
         self.form: Optional["Form"] = None
         self.disabled = disabled
         self.widget = widget
+        self.validation_delay = validation_delay
+        # show_if may simply name a field, shown while its value is true.
+        if isinstance(show_if, str):
+            show_if = Condition([show_if], lambda **values: all(values.values()))
+        self.show_if = show_if
+        self.hidden = False
+        self.errors: List[str] = []
+        self.field_errors: List[str] = []
+        self._raw_value = _UNSET
+        self._initial = _UNSET  # The raw value the form was loaded with
+        self._last_validation: Optional[tuple] = None  # (value, messages)
+
+    def bind(self, form) -> "Field":
+        """
+        Return this field's copy for a single form instance.
+
+        The copy shares everything fixed when the form class was declared
+        (label, validators, widget arguments, choices, ...) with this field,
+        and has its own per-instance state: form, widget, value and errors.
+        """
+        field = object.__new__(type(self))
+        field.__dict__.update(self.__dict__)
+        field.form = form
+        field.hidden = False
+        field.errors = []
+        field.field_errors = []
+        field._raw_value = _UNSET
+        field._initial = _UNSET
+        field._last_validation = None
+        return field
+
+    def mark_clean(self):
+        """
+        Make the field's current value its initial value.
+        """
+        self._initial = self.raw_value
 
     @property
-    def value(self):
+    def modified(self) -> bool:
+        """
+        Does the field's value differ from its initial value?
+        """
+        return self.raw_value != self._initial
+
+    @property
+    def async_validators(self) -> List[AsyncValidator]:
+        return [v for v in self.validators if isinstance(v, AsyncValidator)]
+
+    @property
+    def needs_validation(self) -> bool:
+        """
+        Has the value changed since the field was last validated?
+        """
+        return self._last_validation is None or self._last_validation[0] != self.validation_key()
+
+    def validation_key(self) -> Any:
+        """
+        What identifies the field's current value when deciding whether it
+        has been validated already: by default, the value itself.
+        """
+        return self.raw_value
+
+    def record_validation(self, value: Any, messages: List[str]):
+        """
+        Remember the outcome of validating value, so that it need not be
+        validated again while the field keeps that value.
+        """
+        self._last_validation = (value, list(messages))
+
+    def validate(self) -> List[str]:
+        """
+        Run the field's synchronous validation, returning any failure messages.
+        """
+        value = self.raw_value
+        if self._last_validation is not None and self._last_validation[0] == value:
+            return self._last_validation[1]
+        with instrumentation.span("validate", field=self):
+            if self.widget is None:
+                # Not mounted (e.g. scrolled out of a VirtualRenderedForm), so
+                # check the remembered value headlessly.
+                messages = self.check(value)
+            elif self.is_empty(value):
+                # As check does, so mounting a field doesn't change whether
+                # its value is valid
+                messages = [REQUIRED] if self.required else []
+            else:
+                messages = failure_messages(self.widget.validate(value))
+        if not self.async_validators:
+            self.record_validation(value, messages)
+        return messages
+
+    async def validate_async(self) -> List[str]:
+        """
+        Run all the field's validation, including its async validators,
+        returning any failure messages.
+        """
+        messages = self.validate()
+        if not messages and self.needs_validation:
+            key, value = self.validation_key(), self.raw_value
+            messages = await self.run_async_validators(value)
+            self.record_validation(key, messages)
+        return messages
+
+    async def run_async_validators(self, value: Any) -> List[str]:
+        """
+        Run the field's async validators concurrently against value.
+        """
+        validators = self.async_validators
+        if not validators or (not value and not self.required):
+            return []
+        results = await asyncio.gather(*(self._timed_validate_async(v, value) for v in validators))
+        return failure_messages(ValidationResult.merge(results))
+
+    async def _timed_validate_async(self, validator: AsyncValidator, value: Any) -> ValidationResult:
+        with instrumentation.span("validator", field=self, validator=validator):
+            return await validator.validate_async(value)
+
+    def check(self, value: Any) -> List[str]:
+        """
+        Validate a data value headlessly, with no widget involved: check
+        that a required value is present, coerce it to its Python type and
+        run the synchronous validators on it, returning any failure
+        messages. A ThreadedValidator's validator is run directly; other
+        async validators are skipped.
+        """
+        if self.is_empty(value):
+            return [REQUIRED] if self.required else []
+        raw = self.to_widget_value(value)
+        try:
+            self.to_python(raw)
+        except ValueError as e:
+            return [str(e)]
+        messages: List[str] = []
+        for validator in self.validators:
+            if isinstance(validator, ThreadedValidator):
+                validator = validator.validator  # Headless, so run it in place
+            elif isinstance(validator, AsyncValidator):
+                continue
+            result = validator.validate(raw)
+            if not result.is_valid:
+                messages.extend(result.failure_descriptions)
+        return messages
+
+    def coerce(self, value: Any) -> Any:
+        """
+        The Python value of a data value, or None when it is empty or can't
+        be converted.
+        """
+        if self.is_empty(value):
+            return None
+        try:
+            return self.to_python(self.to_widget_value(value))
+        except ValueError:
+            return None
+
+    def is_empty(self, value: Any) -> bool:
+        """
+        Is value, a data value, missing?
+        """
+        return value is None or value == ""
+
+    def converter(self) -> Callable[[Any], Any]:
+        """
+        A function converting a data value to the field's Python value
+        (None when it is empty), raising ValueError with the message check
+        would report when it can't. Forms build these once per class (see
+        Coercer), so subclasses may return a function specialised to them.
+        """
+        required = self.required
+        is_empty, to_widget_value, to_python = self.is_empty, self.to_widget_value, self.to_python
+
+        def convert(value):
+            if is_empty(value):
+                if required:
+                    raise ValueError(REQUIRED)
+                return None
+            return to_python(to_widget_value(value))
+        return convert
+
+    def to_python(self, value: Any) -> Any:
+        """
+        Convert a widget value to the field's Python value, raising
+        ValueError with a failure message when it can't be converted.
+        """
+        return value
+
+    def show_errors(self, messages: List[str]):
+        """
+        Make messages the field's own errors. They are shown followed by
+        the messages of any failing cross-field validators that report to
+        the field.
+        """
+        self.field_errors = list(messages)
+        self.refresh_errors()
+
+    def refresh_errors(self):
+        """
+        Bring the field's errors up to date, touching the display only
+        when they differ from the errors already shown. Hidden fields
+        show no errors.
+        """
+        if self.hidden:
+            messages = []
+        else:
+            messages = list(self.field_errors)
+            if self.form is not None:
+                messages += self.form.rule_messages(self.name)
+        if messages == self.errors:
+            return
+        self.errors = messages
+        if self.widget is not None and self.widget.parent is not None:
+            with instrumentation.span("show_errors", field=self):
+                self.form.rform.display_errors(self, messages)
+
+    @property
+    def raw_value(self):
+        """
+        The value in the form the widget holds it. While no widget is
+        attached the field remembers the value itself.
+        """
+        if self.widget is None:
+            if self._raw_value is _UNSET:
+                return self.default_raw_value()
+            return self._raw_value
         return self.widget.value
 
+    @raw_value.setter
+    def raw_value(self, value):
+        if self.widget is None:
+            self._raw_value = value
+        else:
+            self.widget.value = value
+
+    def default_raw_value(self) -> Any:
+        return self.kwargs.get("value", "")
+
+    def attach_widget(self, widget):
+        """
+        Make widget the field's widget, handing it any value remembered
+        while the field had no widget.
+        """
+        self.widget = widget
+        if self._raw_value is not _UNSET:
+            widget.value = self._raw_value
+            self._raw_value = _UNSET
+        return widget
+
+    def detach_widget(self):
+        """
+        Forget the field's widget, remembering its value so the widget
+        can be unmounted without losing data.
+        """
+        if self.widget is not None:
+            self._raw_value = self.raw_value
+            self.widget = None
+
+    @property
+    def value(self):
+        return self.raw_value
+
     @value.setter
     def value(self, value):  # Only works with string-valued widgets
-        self.widget.value = str(value)
+        self.raw_value = str(value)
 
     def to_widget_value(self, value: Any) -> Any:
-        return value
+        """
+        Convert a data value to the value the widget holds (by default, a string).
+        """
+        return "" if value is None else str(value)
+
+    def display_value(self, value: Any) -> str:
+        """
+        A data value as text, for showing in a cell of a grid.
+        """
+        return "" if value is None else str(value)
+
+    def data_value(self) -> Any:
+        """
+        The field's current value as data: None when it is empty, the raw
+        value when that can't be converted (so that checking it says why),
+        and otherwise its Python value.
+        """
+        raw = self.raw_value
+        if self.is_empty(None) and raw == self.to_widget_value(None):
+            return None
+        try:
+            return self.to_python(raw)
+        except ValueError:
+            return raw
 
     def create_widget(self):
         if self.widget is None:
             raise NotImplementedError("Fields with no default widget must implement create_widget()")
 
+    def timed_create_widget(self):
+        """
+        Call create_widget inside a "create_widget" instrumentation span.
+        """
+        with instrumentation.span("create_widget", field=self):
+            return self.create_widget()
+
 
 class StringField(Field):
     def create_widget(self):
+        from .widget import StringWidget
         return StringWidget(field=self, valid_empty=not self.required, validators=self.validators, **self.kwargs)
 
+    def converter(self) -> Callable[[Any], Any]:
+        if type(self).to_python is not Field.to_python:
+            return super().converter()
+        return string_converter(self.required)
+
 class IntegerField(Field):
+    python_type = int
+
     def create_widget(self):
+        from .widget import IntegerWidget
         return IntegerWidget(field=self, valid_empty=not self.required, validators=self.validators, **self.kwargs)
 
+    def converter(self) -> Callable[[Any], Any]:
+        if type(self).to_python is not IntegerField.to_python:
+            return super().converter()
+        required = self.required
+
+        def convert(value):
+            if value is None or value == "":
+                if required:
+                    raise ValueError(REQUIRED)
+                return None
+            if type(value) is int:
+                return value
+            try:
+                return int(str(value))
+            except ValueError:
+                raise ValueError("Must be a valid integer.") from None
+        return convert
+
+    def to_python(self, value: str) -> int:
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError("Must be a valid integer.") from None
+
     @property
     def value(self) -> Optional[int]:
         try:
-            return int(self.widget.value)
+            return self.to_python(self.raw_value)
         except ValueError:
             return None
 
     @value.setter
     def value(self, value):
-        self.widget.value = str(value)
+        self.raw_value = str(value)
 
 class TextField(Field):
     def create_widget(self):
+        from .widget import TextWidget
         return TextWidget(field=self, **self.kwargs)
 
+    def converter(self) -> Callable[[Any], Any]:
+        if type(self).to_python is not Field.to_python:
+            return super().converter()
+        return string_converter(self.required)
+
+    def default_raw_value(self) -> str:
+        return self.kwargs.get("text", "")
+
+
+class LargeTextField(TextField):
+    """
+    A TextField for very large documents, such as logs or notes, whose
+    widget tracks its edits rather than handing out copies of the text.
+
+    max_length and max_lines limit the size of the text, and are checked
+    without reading it. LineValidators among validators are re-checked
+    only for the lines changed since the field was last validated; any
+    other validators are passed the whole text. Read the text a piece at
+    a time with chunks().
+    """
+
+    def __init__(
+        self,
+        label: str = "",
+        required: bool = True,
+        validators: Optional[List[Callable[[Any], List[str]]]] = None,
+        help_text: str = "",
+        max_length: Optional[int] = None,
+        max_lines: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(label, required, validators, help_text, **kwargs)
+        self.max_length = max_length
+        self.max_lines = max_lines
+        self._clean_key = None  # The validation key when last marked clean
+
+    def create_widget(self):
+        from .widget import LargeTextWidget
+        return LargeTextWidget(field=self, **self.kwargs)
+
+    def validation_key(self) -> Any:
+        # The widget's version identifies its text without reading it.
+        if self.widget is not None:
+            return self.widget, self.widget.version
+        return self.raw_value
+
+    def mark_clean(self):
+        super().mark_clean()
+        self._clean_key = self.validation_key()
+
+    @property
+    def modified(self) -> bool:
+        # Only compare the text itself when it has been edited back to its
+        # initial length.
+        if self.validation_key() == self._clean_key:
+            return False
+        if self.widget is not None and self.widget.length != len(self._initial):
+            return True
+        return super().modified
+
+    def size_messages(self, length: int, line_count: int) -> List[str]:
+        messages = []
+        if self.max_length is not None and length > self.max_length:
+            messages.append(f"At most {self.max_length} characters allowed")
+        if self.max_lines is not None and line_count > self.max_lines:
+            messages.append(f"At most {self.max_lines} lines allowed")
+        return messages
+
+    def check(self, value: Any) -> List[str]:
+        messages = super().check(value)
+        if not self.is_empty(value):
+            text = self.to_widget_value(value)
+            messages = self.size_messages(len(text), len(text.split("\n"))) + messages
+        return messages
+
+    def validate(self) -> List[str]:
+        """
+        Validate the field, from its widget's document while it has one.
+        """
+        key = self.validation_key()
+        if self._last_validation is not None and self._last_validation[0] == key:
+            return self._last_validation[1]
+        with instrumentation.span("validate", field=self):
+            if self.widget is None:
+                messages = self.check(self.raw_value)
+            else:
+                messages = self.check_document(self.widget)
+        if not self.async_validators:
+            self.record_validation(key, messages)
+        return messages
+
+    def check_document(self, widget) -> List[str]:
+        if widget.length == 0:
+            return [REQUIRED] if self.required else []
+        messages = self.size_messages(widget.length, widget.line_count)
+        line_validators = [v for v in self.validators if isinstance(v, LineValidator)]
+        messages += widget.check_lines(line_validators)
+        for validator in self.validators:
+            if not isinstance(validator, (LineValidator, AsyncValidator)):
+                messages += failure_messages(validator.validate(widget.value))
+        return messages
+
+    def chunks(self, size: int = 65536) -> Iterator[str]:
+        """
+        The text in successive pieces of size characters.
+        """
+        if self.widget is not None:
+            yield from self.widget.chunks(size)
+            return
+        text = self.raw_value
+        for start in range(0, len(text), size):
+            yield text[start:start + size]
+
 
 class BooleanField(Field):
+    widget_shows_label = True
+    python_type = bool
     def create_widget(self):
+        from .widget import CheckboxWidget
         return CheckboxWidget(field=self, label=self.label, **self.kwargs)
 
+    def is_empty(self, value: Any) -> bool:
+        return False  # Anything else is read as unchecked
+
     def to_python(self, value: bool) -> bool:
         return value
 
+    def display_value(self, value: Any) -> str:
+        return "✓" if self.to_widget_value(value) else ""
+
+    def to_widget_value(self, value: Any) -> bool:
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "yes", "on", "1")
+        return bool(value)
+
+    def default_raw_value(self) -> bool:
+        return self.kwargs.get("value", False)
+
     @property
     def value(self):
-        return self.widget.value
+        return self.raw_value
 
     @value.setter
     def value(self, value):
-        self.widget.value = value
+        self.raw_value = value
 
 class ChoiceField(Field):
+    python_type = Any
 
     def __init__(
         self,
@@ -94,10 +598,105 @@ class ChoiceField(Field):
         self.choices = choices
         self.kwargs = kwargs
         self.required = required
+        self._choice_values = None  # Built when first needed
         super().__init__(label, required, validators, help_text, **kwargs)
 
+    # The field holds None for no choice; only the widget, once there is
+    # one, holds Select's blank value in its place.
+
     def create_widget(self):
-        return SelectWidget(field=self, choices=self.choices, allow_blank=not self.required, **self.kwargs)
+        from .widget import SelectWidget
+        kwargs = self.kwargs
+        if "value" in kwargs and kwargs["value"] is None:
+            kwargs = dict(kwargs, value=SelectWidget.NULL)
+        return SelectWidget(field=self, choices=self.choices, allow_blank=not self.required, **kwargs)
+
+    def attach_widget(self, widget):
+        if self._raw_value is None:
+            self._raw_value = widget.NULL
+        return super().attach_widget(widget)
+
+    @property
+    def raw_value(self):
+        if self.widget is None:
+            return Field.raw_value.fget(self)
+        value = self.widget.value
+        return None if value == self.widget.NULL else value
+
+    @raw_value.setter
+    def raw_value(self, value):
+        if self.widget is not None and value is None:
+            value = self.widget.NULL
+        Field.raw_value.fset(self, value)
+
+    def default_raw_value(self) -> Any:
+        if "value" in self.kwargs:
+            return self.kwargs["value"]
+        if self.required and self.choices:
+            return self.choices[0][1]  # What a Select that can't be blank starts with
+        return None
 
     def to_python(self, value: str) -> str:
+        if self._choice_values is None:
+            self._choice_values = frozenset(choice for label, choice in self.choices)
+        if value not in self._choice_values:
+            raise ValueError("Not a valid choice")
+        return value
+
+    def to_widget_value(self, value: Any) -> Any:
+        return value
+
+    def is_empty(self, value: Any) -> bool:
+        return value is None
+
+    def display_value(self, value: Any) -> str:
+        for label, choice in self.choices:
+            if choice == value:
+                return label
+        return super().display_value(value)
+
+
+class LargeChoiceField(ChoiceField):
+    """
+    A ChoiceField for very large option sets, chosen by typing to search
+    rather than from a dropdown of every option.
+
+    choices may be a list of (label, value) pairs, an iterator over them,
+    or a callable returning one. They are indexed the first time the field
+    is used, and the index is shared by every instance of the form. At most
+    limit matching options are shown at a time.
+    """
+
+    def __init__(
+        self,
+        choices: Choices,
+        label: str = "",
+        required: bool = True,
+        validators: Optional[List[Callable[[Any], List[str]]]] = None,
+        help_text: str = "",
+        limit: int = 50,
+        **kwargs,
+    ):
+        super().__init__(choices, label, required, validators, help_text, **kwargs)
+        self.index = ChoiceIndex(choices)
+        self.limit = limit
+
+    def create_widget(self):
+        from .widget import LargeSelectWidget
+        return LargeSelectWidget(field=self, index=self.index, limit=self.limit, required=self.required, **self.kwargs)
+
+    # LargeSelectWidget holds None for no choice itself
+    raw_value = Field.raw_value
+    attach_widget = Field.attach_widget
+
+    def default_raw_value(self) -> Any:
+        return self.kwargs.get("value")
+
+    def to_python(self, value: Any) -> Any:
+        if value not in self.index:
+            raise ValueError("Not a valid choice")
         return value
+
+    def display_value(self, value: Any) -> str:
+        label = self.index.label(value)
+        return label if label is not None else Field.display_value(self, value)
@@ -1,137 +1,159 @@
 # form.py
-import copy
+import asyncio
+from types import MappingProxyType
 
+from .coerce import Coercer
 from .field import Field
+from .instrument import instrumentation
+from .validators import FormValidator, failure_messages
 
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, Mapping, Optional, List, Set, Tuple
 
-from textual import on
-from textual.containers import Vertical, Center, Horizontal, VerticalScroll
-from textual.widgets import Button, Static
 from textual.message import Message
 
+if TYPE_CHECKING:
+    from .rendered import RenderedForm
+
+# The rendered forms are only imported when a form is first rendered (or
+# they are imported from here), so that declaring forms and validating data
+# headlessly doesn't import Textual's widgets.
+_RENDERED = ("RenderedForm", "CompactRenderedForm", "VirtualRow", "VirtualRenderedForm", "WizardRenderedForm")
+
+def __getattr__(name):
+    if name in _RENDERED:
+        from . import rendered
+        return getattr(rendered, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class FormSchema:
+    """
+    The fields of a Form class and their layout, compiled once when the
+    class is created and shared by all its instances, along with the
+    dependency graph of its cross-field validators (the rules that read
+    each field, and the rules that report to each field) and of its
+    conditional fields (the fields whose show_if reads each field, and the
+    conditional fields in an order where every field comes after those
+    its condition reads).
+    """
+    MAX_ORDERINGS = 64  # distinct field_orders remembered per class
+
+    def __init__(self, fields: Dict[str, Field], rules: Optional[Dict[str, FormValidator]] = None):
+        self.fields = MappingProxyType(dict(fields))
+        self.names: Tuple[str, ...] = tuple(fields)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self._orderings: Dict[Optional[Tuple[str, ...]], Tuple[str, ...]] = {None: self.names}
+        self.rules = MappingProxyType(dict(rules or {}))
+        self.dependents: Dict[str, Tuple[FormValidator, ...]] = {}
+        self.reports: Dict[str, Tuple[FormValidator, ...]] = {}
+        for name, rule in self.rules.items():
+            for field_name in rule.fields + rule.report_to:
+                if field_name not in self.index:
+                    raise ValueError(f"Form validator {name!r} refers to unknown field {field_name!r}")
+            for field_name in rule.fields:
+                self.dependents[field_name] = self.dependents.get(field_name, ()) + (rule,)
+            for field_name in rule.report_to:
+                self.reports[field_name] = self.reports.get(field_name, ()) + (rule,)
+        self.controls: Dict[str, Tuple[str, ...]] = {}
+        for name, field in self.fields.items():
+            for field_name in field.show_if.fields if field.show_if is not None else ():
+                if field_name not in self.index:
+                    raise ValueError(f"Field {name!r} is shown conditionally on unknown field {field_name!r}")
+                self.controls[field_name] = self.controls.get(field_name, ()) + (name,)
+        self.conditional: Tuple[str, ...] = self._conditional_order()
+
+    def _conditional_order(self) -> Tuple[str, ...]:
+        order: List[str] = []
+        done = set()
+        visiting = set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Field {name!r} is shown conditionally on itself")
+            visiting.add(name)
+            condition = self.fields[name].show_if
+            for field_name in condition.fields if condition is not None else ():
+                visit(field_name)
+            visiting.discard(name)
+            done.add(name)
+            if condition is not None:
+                order.append(name)
+
+        for name in self.names:
+            visit(name)
+        return tuple(order)
+
+    def ordering(self, field_order: Optional[List[str]] = None) -> Tuple[str, ...]:
+        """
+        The field names arranged according to field_order, as described for
+        BaseForm.order_fields. Orderings are computed once and then reused.
+        """
+        key = None if field_order is None else tuple(field_order)
+        try:
+            return self._orderings[key]
+        except KeyError:
+            pass
+        first = [name for name in dict.fromkeys(key) if name in self.index]
+        chosen = set(first)
+        ordering = tuple(first + [name for name in self.names if name not in chosen])
+        if len(self._orderings) < self.MAX_ORDERINGS:
+            self._orderings[key] = ordering
+        return ordering
+
+
 class FormMetaclass(type):
-    """Collect Fields declared on the base classes."""
+    """Collect Fields and FormValidators declared on the class and its base classes."""
     def __new__(mcs, name, bases, attrs):
-        # Collect fields from current class.
+        # Collect fields and cross-field validators from current class.
         current_fields = []
+        current_rules = []
         for key, value in list(attrs.items()):
             if isinstance(value, Field):
                 # add each field to current_fields and remove as attribute
+                value.name = key
                 current_fields.append((key, value))
                 attrs.pop(key)
-        _declared_fields = dict(current_fields)
+            elif isinstance(value, FormValidator):
+                value.name = key
+                current_rules.append((key, value))
+                attrs.pop(key)
+        # The declared fields are prototypes shared by every instance of the
+        # class, which binds its own copies of them, so they are read-only.
+        attrs["_declared_fields"] = MappingProxyType(dict(current_fields))
+        attrs["_declared_rules"] = MappingProxyType(dict(current_rules))
 
         new_class = super().__new__(mcs, name, bases, attrs)
 
-        new_class._base_fields = _declared_fields
-        new_class._declared_fields = _declared_fields
+        # Walk through the MRO, so that fields declared in subclasses come
+        # after inherited ones and override them. A subclass can remove an
+        # inherited field by setting its name to None.
+        base_fields: Dict[str, Field] = {}
+        base_rules: Dict[str, FormValidator] = {}
+        for base in reversed(new_class.__mro__):
+            base_fields.update(base.__dict__.get("_declared_fields", {}))
+            base_rules.update(base.__dict__.get("_declared_rules", {}))
+            for attr, value in base.__dict__.items():
+                if value is None:
+                    base_fields.pop(attr, None)
+                    base_rules.pop(attr, None)
+
+        new_class._schema = FormSchema(base_fields, base_rules)
+        new_class._base_fields = new_class._schema.fields
 
         return new_class
 
-class RenderedForm(VerticalScroll):
-
-    DEFAULT_CSS = """\
-RenderedForm {
-    keyline: heavy blue;
-}
-Vertical {
-    width: 1fr;
-    height: auto;
-}
-#form-title {
-    background: red;
-    height: 1;
-    margin: 1;
-}
-ChoiceWidget, StringInput, IntegerInput, #form-title {
-    padding: 0;
-}
-Static {
-    width: auto;
-}
-Center {
-    width: 1fr;
-}
-#buttons {
-    height: auto;
-    align: center middle;
-}
-TextWidget {
-    height: 6;
-}
-"""
-
-    def __init__(
-        self,
-        form,
-        data: Optional[Dict[str, Any]] = None,
-        field_order: Optional[List[str]] = None,
-        id=None,
-    ):
-        super().__init__(*form.children, id=id, **form.kwargs)
-        self.form = form
-        self.fields = form.fields
-        self.data = data
-        self.field_order = field_order
-        if data is not None:
-            self.set_data(data)
-
-
-    def compose(self):
-        if self.form.title is not None:
-            yield Vertical(
-                Center(Static(f"---- {self.form.title} ----")), id="form-title"
-            )
-        for name, field in self.form.fields.items():
-            yield Vertical(field.widget)
-            if self.data and name in self.data:
-                field.value = self.data[name]
-        yield Vertical(
-            Horizontal(
-                Button("Cancel", id="cancel"),
-                Button("Submit", id="submit"),
-                id="buttons"
-            ),
-            id="outer-buttons"
-        )
-
-
-    def get_data(self) -> Dict[str, Any]:
-        return self.form.get_data()
-
-    def set_data(self, data: Dict[str, Any]):
-        return self.form.set_data(data)
-
-    async def validate(self):
-        return self.form.validate()
-
-    @on(Button.Pressed, "#submit")
-    async def submit_pressed(self, event: Button.Pressed) -> None:
-        """
-        When form is submitted, validate it and if successful post a Submitted message.
-        """
-        if await self.validate():
-            self.post_message(Form.Submitted(self))
-        else:
-            self.app.notify("Please fix the issues before submitting")
-
-    @on(Button.Pressed, "#cancel")
-    async def cancel_pressed(self, event: Button.Pressed) -> None:
-        """
-        When form is cancelled qpost a Cancelled message.
-        """
-        self.post_message(Form.Cancelled(self))
-
 class BaseForm:
 
+    pages: Optional[List[List[str]]] = None  # The field names on each page of a WizardRenderedForm
+
     def __init__(
         self,
         *children,
         data: Optional[Dict[str, Any]] = None,
         field_order: Optional[List[str]] = None,
         title: Optional[str] = None,
-        render_type=RenderedForm,
+        render_type: Optional[type] = None,
         **kwargs,
     ):
         self.data = data
@@ -141,41 +163,151 @@ class BaseForm:
         self.kwargs = kwargs
         self.fields: Dict[str, Field] = {}
         self.render_type = render_type
+        self.rform: Optional["RenderedForm"] = None
+        self.rule_errors: Dict[str, List[str]] = {}  # Messages of failing cross-field validators
+        self.modified: Set[str] = set()  # Names of the fields changed since the form was loaded
         self._populate_fields(field_order)
+        if data:
+            self.set_data(data, validate=False)
+        self.update_visibility()
+        self.mark_clean()
 
-        # THIS CHUNK FROM DJANGO
+    def _populate_fields(self, field_order: Optional[List[str]] = None):
         # The _base_fields class attribute is the *class-wide* definition of
         # fields. Because a particular *instance* of the class might want to
-        # alter self.fields, we create self.fields here by copying _base_fields.
+        # alter self.fields, we create self.fields here by binding a copy of
+        # each of the _base_fields to this instance, in the order the class's
+        # schema has compiled for field_order. Binding shares the parts of a
+        # field fixed at declaration, so is much cheaper than a deep copy.
         # Instances should always modify self.fields; they should not modify
         # self._base_fields.
-        self.fields = copy.deepcopy(self._base_fields)
-        self.order_fields(self.field_order)
-        # THIS CHUNK FROM DJANGO ENDS
+        base_fields = self._base_fields
+        self.fields = {
+            name: base_fields[name].bind(self) for name in self._schema.ordering(field_order)
+        }
 
-    def _populate_fields(self, field_order: Optional[List[str]] = None):
-        if field_order:
-            for name in field_order:
-                if name in self._declared_fields:
-                    self.fields[name] = self._declared_fields[name]
-                    self.fields[name].name = name
-                    self.fields[name].form = self
-        else:
-            for name, field in self._declared_fields.items():
-                self.fields[name] = field
-                field.name = name
-                field.form = self
-
-    def get_data(self) -> Dict[str, Any]:
+    def get_data(self, include_hidden: bool = True) -> Dict[str, Any]:
         data: Dict[str, Any] = {}
         for name, field in self.fields.items():
-            data[name] = field.value
+            if include_hidden or not field.hidden:
+                data[name] = field.value
         return data
 
-    def set_data(self, data: Dict[str, Any]):
-        for name, value in data.items():
-            if name in self.fields:
-                self.fields[name].widget.value = str(value)
+    def set_data(self, data: Dict[str, Any], validate: bool = True, reset: bool = False):
+        """
+        Load the values in data into the fields of the same name. With
+        reset, fields missing from data are reset to their default values.
+
+        Once the form is mounted the values are applied in a single batched
+        update with the widgets' change events and live validation
+        suppressed. Instead, unless validate is False, the loaded fields are
+        validated once all the values are in place.
+        """
+        values = [(field, field.to_widget_value(data[name])) for name, field in self.fields.items() if name in data]
+        if reset:
+            values += [(field, field.default_raw_value()) for name, field in self.fields.items() if name not in data]
+        names = [field.name for field, value in values]
+        if self.rform is None or not self.rform.is_mounted:
+            for field, value in values:
+                field.raw_value = value
+            self.update_modified(names)
+            self.update_visibility(names)
+            return
+        from .widget import changes_suppressed
+
+        with changes_suppressed(self.rform, [field.widget for field, value in values]):
+            for field, value in values:
+                field.raw_value = value
+        self.update_modified(names)
+        self.update_visibility(names)
+        if validate:
+            for field, value in values:
+                field.show_errors([] if field.hidden else field.validate())
+            self.check_rules(names)
+
+    @classmethod
+    def check_data(cls, data: Mapping[str, Any]) -> Dict[str, List[str]]:
+        """
+        Validate a dict of data headlessly, without creating a form or any
+        widgets, returning the failure messages of each field that fails.
+        An empty result means the data is valid.
+
+        Each field's value is checked as by Field.check (a missing value
+        counts as empty), and then the cross-field validators are run on
+        the coerced values, unless any of the fields they read has failed.
+        Fields that the data's values would hide are not checked. Async
+        validators other than ThreadedValidators are not run.
+        """
+        errors: Dict[str, List[str]] = {}
+        fields = cls._schema.fields
+        hidden = cls.hidden_names(data)
+        for name, field in fields.items():
+            if name not in hidden:
+                messages = field.check(data.get(name))
+                if messages:
+                    errors[name] = messages
+        for rule in cls._schema.rules.values():
+            if any(name in errors or name in hidden for name in rule.fields):
+                continue
+            values = {name: fields[name].coerce(data.get(name)) for name in rule.fields}
+            result = rule.validate(values)
+            if not result.is_valid:
+                for name in rule.report_to:
+                    errors.setdefault(name, []).extend(result.failure_descriptions)
+        return errors
+
+    @classmethod
+    def hidden_names(cls, data: Mapping[str, Any]) -> Set[str]:
+        """
+        The names of the conditional fields that a dict of data's values
+        would hide.
+        """
+        fields = cls._schema.fields
+        hidden: Set[str] = set()
+        for name in cls._schema.conditional:
+            condition = fields[name].show_if
+            if any(field_name in hidden for field_name in condition.fields) or not condition.evaluate(
+                {field_name: fields[field_name].coerce(data.get(field_name)) for field_name in condition.fields}
+            ):
+                hidden.add(name)
+        return hidden
+
+    @classmethod
+    def check_records(cls, records: Iterable[Mapping[str, Any]]) -> Iterator[Dict[str, List[str]]]:
+        """
+        Lazily check_data each of records in turn, yielding their errors.
+        """
+        check_data = cls.check_data
+        for record in records:
+            yield check_data(record)
+
+    @classmethod
+    def coercer(cls) -> Coercer:
+        """
+        The class's Coercer, which converts its data to typed records and
+        back, built the first time it is needed.
+        """
+        coercer = cls.__dict__.get("_coercer")
+        if coercer is None:
+            coercer = cls._coercer = Coercer(cls)
+        return coercer
+
+    def get_record(self):
+        """
+        The form's values as an instance of the class's record type,
+        raising CoercionError when any can't be converted. Hidden fields
+        are None.
+        """
+        return self.coercer().record(
+            {name: field.data_value() for name, field in self.fields.items() if not field.hidden},
+            {name for name, field in self.fields.items() if field.hidden},
+        )
+
+    def set_record(self, record, validate: bool = True):
+        """
+        Load an instance of the class's record type into the form.
+        """
+        self.set_data(self.coercer().as_dict(record), validate)
 
     def order_fields(self, field_order):
         """
@@ -190,48 +322,171 @@ class BaseForm:
         """
         if field_order is None:
             return
-        fields = {}
-        for key in field_order:
-            try:
-                fields[key] = self.fields.pop(key)
-            except KeyError:  # ignore unknown fields
-                pass
-        for k in list(self.fields):
-            fields[k] = self.fields.pop(k)
-        assert not self.fields
+        fields = {key: self.fields[key] for key in field_order if key in self.fields}
+        fields.update(self.fields)  # Keeps the positions of the keys already present
         self.fields = fields
 
-
-    def render(self, id) -> RenderedForm:
+    def render(self, id, recycle: Optional["RenderedForm"] = None) -> "RenderedForm":
         """
         Return a Vertical subclass with all the widgets inside it. The
         widgets are extracted from each field in turn and rendered inside the
         Vertical, followed by the buttons.
 
+        Passing a form already rendered from the same form class as recycle
+        rebinds its widgets to this form instead of creating new ones, which
+        is much cheaper when paging through records.
+
         XXX There's no way to specify the buttons, so there's just a submit
         for the present.
         """
-        for name, field in self.fields.items():
-            field.widget = field.create_widget()
-        self.rform = self.render_type(self, id=id, data=self.data, field_order=self.field_order)
+        if recycle is not None:
+            recycle.rebind(self, self.data or {})
+            return recycle
+        render_type = self.render_type
+        if render_type is None:
+            from .rendered import RenderedForm as render_type
+        if render_type.create_widgets:
+            for name, field in self.fields.items():
+                field.attach_widget(field.timed_create_widget())
+        self.rform = render_type(self, id=id, data=self.data, field_order=self.field_order)
         return self.rform
 
     def validate(self):
         """
         Validate (and update with messages as appropriate) all fields in
-        the form.
+        the form. Async validators are only run by validate_async.
+
+        Fields whose values have not changed since they were last validated
+        reuse that result, and only fields whose messages change have their
+        display updated. Hidden fields are not validated.
         """
-        result = True
         for name, field in self.fields.items():
-            widget = field.widget
-            container = widget.parent
-            container.remove_children(".erm")
-            vr = widget.validate(widget.value)
-            if vr is not None and not vr.is_valid:
-                result = False
-                for msg in vr.failure_descriptions:
-                    container.mount(Center(Static(msg), classes="erm"))
-        return result
+            field.show_errors([] if field.hidden else field.validate())
+        self.check_rules()
+        return not any(field.errors for field in self.fields.values())
+
+    async def validate_async(self):
+        """
+        Validate all fields in the form, running async validators
+        concurrently across fields, so that validation takes as long as the
+        slowest field rather than the sum of them all.
+        """
+        fields = [field for field in self.fields.values() if not field.hidden]
+        results = await asyncio.gather(*(field.validate_async() for field in fields))
+        for field, messages in zip(fields, results):
+            field.show_errors(messages)
+        self.check_rules()
+        return not any(field.errors for field in fields)
+
+    def check_rules(self, names: Optional[List[str]] = None):
+        """
+        Re-evaluate the cross-field validators that read any of the fields
+        named in names (or all of them, when names is None), and update the
+        errors of the fields whose messages change as a result.
+        """
+        schema = self._schema
+        if not schema.rules:
+            return
+        if names is None:
+            rules = schema.rules.values()
+        else:
+            rules = dict.fromkeys(rule for name in names for rule in schema.dependents.get(name, ()))
+        changed = set()
+        for rule in rules:
+            if any(self.fields[name].hidden for name in rule.fields):
+                messages = []
+            else:
+                # The same coerced values check_data passes
+                values = {name: self.fields[name].coerce(self.fields[name].raw_value) for name in rule.fields}
+                with instrumentation.span("validator", self, validator=rule):
+                    messages = failure_messages(rule.validate(values))
+            if messages != self.rule_errors.get(rule.name, []):
+                self.rule_errors[rule.name] = messages
+                changed.update(rule.report_to)
+        for name in changed:
+            self.fields[name].refresh_errors()
+
+    def update_visibility(self, names: Optional[List[str]] = None):
+        """
+        Re-evaluate the show_if conditions of the fields that depend, directly
+        or through other conditional fields, on the fields named in names
+        (or of every conditional field, when names is None), and hide or
+        show the fields whose visibility changes.
+        """
+        schema = self._schema
+        if not schema.conditional:
+            return
+        if names is not None:
+            affected = set()
+            pending = list(names)
+            while pending:
+                for name in schema.controls.get(pending.pop(), ()):
+                    if name not in affected:
+                        affected.add(name)
+                        pending.append(name)
+        for name in schema.conditional:
+            if names is not None and name not in affected:
+                continue
+            field = self.fields[name]
+            condition = field.show_if
+            controllers = [self.fields[field_name] for field_name in condition.fields]
+            hidden = any(c.hidden for c in controllers) or not condition.evaluate(
+                {c.name: c.coerce(c.raw_value) for c in controllers}
+            )
+            if hidden != field.hidden:
+                field.hidden = hidden
+                field.show_errors([])
+                if self.rform is not None:
+                    self.rform.field_visibility_changed(field)
+
+    def rule_messages(self, name: str) -> List[str]:
+        """
+        The messages of the failing cross-field validators that report to the named field.
+        """
+        return [msg for rule in self._schema.reports.get(name, ()) for msg in self.rule_errors.get(rule.name, ())]
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Has any field changed since the form was loaded (or last marked clean)?
+        """
+        return bool(self.modified)
+
+    def update_modified(self, names: Iterable[str]):
+        """
+        Bring the modified set up to date for the named fields, whose
+        values have just changed.
+        """
+        for name in names:
+            if self.fields[name].modified:
+                self.modified.add(name)
+            else:
+                self.modified.discard(name)
+
+    def mark_clean(self, names: Optional[Iterable[str]] = None):
+        """
+        Make the current values of the named fields (by default, all of
+        them) their initial values, say once they have been saved.
+        """
+        if names is None:
+            names = list(self.fields)
+            self.modified.clear()
+        for name in names:
+            self.fields[name].mark_clean()
+            self.modified.discard(name)
+
+    def get_changes(self, include_hidden: bool = True) -> Dict[str, Any]:
+        """
+        The values of just the modified fields, as get_data would return
+        them, in the order the fields were declared.
+        """
+        index = self._schema.index
+        data: Dict[str, Any] = {}
+        for name in sorted(self.modified, key=index.__getitem__):
+            field = self.fields[name]
+            if include_hidden or not field.hidden:
+                data[name] = field.value
+        return data
 
 
 class Form(BaseForm, metaclass=FormMetaclass):
@@ -243,12 +498,12 @@ class Form(BaseForm, metaclass=FormMetaclass):
     # BaseForm itself has no way of designating self.fields.
 
     class Submitted(Message):
-        def __init__(self, r_form: RenderedForm):
+        def __init__(self, r_form: "RenderedForm"):
             super().__init__()
             self.form = r_form
 
     class Cancelled(Message):
-        def __init__(self, r_form: RenderedForm):
+        def __init__(self, r_form: "RenderedForm"):
             super().__init__()
             self.form = r_form
 
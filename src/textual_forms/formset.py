@@ -0,0 +1,72 @@
+# formset.py
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from .rendered import RenderedFormSet
+
+Errors = Dict[str, List[str]]
+
+
+class FormSet:
+    """
+    A list of rows (records, such as the lines of an invoice) that each
+    follow the same Form subclass. Rows are validated headlessly with the
+    form class's check_data, so they get the same field validators and
+    cross-field validators as the form itself.
+
+    Rendered, the rows are shown as a grid of plain text cells. Only the
+    row being edited has real widgets, so thousands of rows cost little
+    more to show than a few.
+    """
+
+    def __init__(self, form_class, rows: Iterable[Dict[str, Any]] = ()):
+        self.form_class = form_class
+        self.names = list(form_class._base_fields)
+        self.rows: List[Dict[str, Any]] = [dict(row) for row in rows]
+        self.errors: Dict[int, Errors] = {}  # The errors of each failing row
+        self.rendered: Optional["RenderedFormSet"] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get_data(self) -> List[Dict[str, Any]]:
+        """
+        Copies of all the rows.
+        """
+        return [dict(row) for row in self.rows]
+
+    def set_data(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Replace all the rows, forgetting their errors.
+        """
+        self.rows = [dict(row) for row in rows]
+        self.errors = {}
+        if self.rendered is not None:
+            self.rendered.reload()
+
+    def validate_row(self, index: int) -> Errors:
+        """
+        Validate one row, returning (and remembering) its errors.
+        """
+        errors = self.form_class.check_data(self.rows[index])
+        if errors:
+            self.errors[index] = errors
+        else:
+            self.errors.pop(index, None)
+        return errors
+
+    def validate(self) -> bool:
+        """
+        Validate every row, returning whether they are all valid.
+        """
+        self.errors = {
+            index: errors for index, errors in enumerate(self.form_class.check_records(self.rows)) if errors
+        }
+        if self.rendered is not None:
+            self.rendered.reload()
+        return not self.errors
+
+    def render(self, id=None) -> "RenderedFormSet":
+        from .rendered import RenderedFormSet
+        self.rendered = RenderedFormSet(self, id=id)
+        return self.rendered
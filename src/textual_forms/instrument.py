@@ -0,0 +1,144 @@
+# instrument.py
+import time
+from collections import Counter
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from textual import log
+
+
+class Span(NamedTuple):
+    """
+    The time taken by one phase of a form's work.
+
+    phase is one of "create_widget", "compose", "mount", "validate",
+    "validator" and "show_errors". field and validator are None for
+    phases of the whole form and of the whole field respectively.
+    """
+    phase: str
+    form: Any
+    field: Any
+    validator: Any
+    duration: float  # seconds
+
+    @property
+    def field_name(self) -> Optional[str]:
+        return None if self.field is None else self.field.name
+
+    def __str__(self):
+        where = ".".join(
+            str(part) for part in (
+                type(self.form).__name__ if self.form is not None else None,
+                self.field_name,
+                type(self.validator).__name__ if self.validator is not None else None,
+            ) if part is not None
+        )
+        return f"{self.phase} {where or '-'} {self.duration * 1000:.3f}ms"
+
+
+Hook = Callable[[Span], None]
+
+_NOT_TIMED = nullcontext()
+
+
+class _Timer:
+    __slots__ = ("instrumentation", "phase", "form", "field", "validator", "start")
+
+    def __init__(self, instrumentation, phase, form, field, validator):
+        self.instrumentation = instrumentation
+        self.phase = phase
+        self.form = form
+        self.field = field
+        self.validator = validator
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.instrumentation.record(self.phase, self.start, self.form, self.field, self.validator)
+
+
+class Instrumentation:
+    """
+    Timing spans and DOM counters for the work forms do.
+
+    Spans are only timed while at least one hook is installed, and are
+    passed to every hook as they finish. With no hooks a span costs one
+    attribute test, so instrumentation can be left in place in production.
+    The counters "mounted" and "removed", of the widgets forms mount and
+    remove once they are running (error messages, and the rows of a
+    VirtualRenderedForm), are always kept.
+    """
+
+    def __init__(self):
+        self.hooks: List[Hook] = []
+        self.counters: Counter = Counter()
+
+    def add_hook(self, hook: Hook) -> Hook:
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: Hook):
+        self.hooks.remove(hook)
+
+    def span(self, phase: str, form=None, field=None, validator=None):
+        """
+        A context manager timing phase for hooks, if any are installed.
+        """
+        if not self.hooks:
+            return _NOT_TIMED
+        if form is None and field is not None:
+            form = field.form
+        return _Timer(self, phase, form, field, validator)
+
+    def record(self, phase: str, start: float, form=None, field=None, validator=None):
+        """
+        Pass hooks a span for phase, which began at time.perf_counter() start.
+        """
+        if not self.hooks:
+            return
+        span = Span(phase, form, field, validator, time.perf_counter() - start)
+        for hook in self.hooks:
+            hook(span)
+
+    def count(self, counter: str, n: int = 1):
+        if n:
+            self.counters[counter] += n
+
+
+instrumentation = Instrumentation()
+
+
+def log_span(span: Span):
+    """
+    A hook that writes spans to the Textual devtools log.
+    """
+    log.debug(f"textual_forms: {span}")
+
+
+class SpanStats:
+    """
+    A hook that totals spans by phase, field name and validator class,
+    for a summary of where a form spends its time.
+    """
+
+    def __init__(self):
+        self.stats: Dict[Tuple[str, Optional[str], Optional[str]], List[float]] = {}
+
+    def __call__(self, span: Span):
+        validator = None if span.validator is None else type(span.validator).__name__
+        key = (span.phase, span.field_name, validator)
+        entry = self.stats.setdefault(key, [0, 0.0, 0.0])  # count, total, max
+        entry[0] += 1
+        entry[1] += span.duration
+        entry[2] = max(entry[2], span.duration)
+
+    def slowest(self, n: int = 10) -> List[Tuple[Tuple[str, Optional[str], Optional[str]], List[float]]]:
+        """
+        The n keys with the greatest total time, with their count, total and maximum.
+        """
+        return sorted(self.stats.items(), key=lambda item: item[1][1], reverse=True)[:n]
+
+    def clear(self):
+        self.stats.clear()
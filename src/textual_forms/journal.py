@@ -0,0 +1,127 @@
+# journal.py
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Union
+
+
+def journal_value(value: Any) -> Any:
+    """
+    The value to journal for a raw widget value. Values JSON can't hold
+    are journalled as None.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    return None
+
+
+class DraftJournal:
+    """
+    A crash-safe, append-only journal of a form's unsaved changes.
+
+    Changed fields are only marked as changed (which costs next to nothing
+    per keystroke); their values are read and appended in a batch when the
+    form flushes the journal, at most once per interval. Each batch is one
+    JSON object per line, synced to disk before the write returns, so a
+    crash loses at most the last interval's typing and at worst leaves a
+    truncated final line, which replay cuts off so the next batch starts on
+    a line of its own. Replaying merges the lines in order. Once more than
+    compact_after lines have been written the journal is compacted into a
+    single line by atomically replacing the file.
+    """
+
+    def __init__(self, path: Union[str, Path], interval: float = 1.0, compact_after: int = 200):
+        self.path = Path(path)
+        self.interval = interval
+        self.compact_after = compact_after
+        self._changed: Set[str] = set()
+        self._lines = None
+        self._lock = threading.Lock()
+        self.generation = 0  # Incremented by clear, so batches taken before it are dropped
+
+    def mark(self, name: str):
+        self._changed.add(name)
+
+    def take(self) -> Set[str]:
+        """
+        Return the names of the fields changed since the last call.
+        """
+        changed, self._changed = self._changed, set()
+        return changed
+
+    def replay(self) -> Dict[str, Any]:
+        """
+        Rebuild the form data recorded in the journal.
+        """
+        data: Dict[str, Any] = {}
+        lines = 0
+        try:
+            with self.path.open("rb+") as f:
+                end = 0  # The end of the last complete line
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:  # Truncated by a crash
+                        entry = None
+                    if not line.endswith(b"\n"):
+                        # A crash cut the last line short: drop what's left
+                        # of it, unless only its newline was lost.
+                        if entry is None:
+                            f.truncate(end)
+                        else:
+                            f.write(b"\n")
+                        f.flush()
+                        os.fsync(f.fileno())
+                    end += len(line)
+                    if entry is not None:
+                        data.update(entry)
+                        lines += 1
+        except FileNotFoundError:
+            pass
+        self._lines = lines
+        return data
+
+    def write(self, values: Dict[str, Any], generation: Optional[int] = None):
+        """
+        Append a batch of field values to the journal and sync it to disk,
+        compacting the journal when it has grown too long. Safe to call
+        from a worker thread. A batch taken at an earlier generation (that
+        is, before the journal was cleared) is dropped.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if self._lines is None:
+                self.replay()
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(values) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._lines += 1
+            if self._lines > self.compact_after:
+                self._compact()
+
+    def compact(self):
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        data = self.replay()
+        temp = self.path.with_name(self.path.name + ".tmp")
+        with temp.open("w", encoding="utf-8") as f:
+            f.write(json.dumps(data) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, self.path)
+        self._lines = 1
+
+    def clear(self):
+        """
+        Discard the journal, once its changes have been saved or abandoned.
+        """
+        with self._lock:
+            self._changed.clear()
+            self.path.unlink(missing_ok=True)
+            self._lines = 0
+            self.generation += 1
@@ -0,0 +1,812 @@
+# rendered.py
+import asyncio
+from bisect import bisect_left, bisect_right
+from functools import partial
+from itertools import accumulate
+import time
+
+from .field import BooleanField, Field, IntegerField, LargeTextField, TextField
+from .form import Form
+from .instrument import instrumentation
+from .journal import DraftJournal, journal_value
+from .stream import RecordStream, Records, Sink
+from .widget import ErrorDisplay, LargeSelectWidget, display_errors
+
+from typing import Dict, Any, Optional, List, Tuple
+
+from textual import on
+from textual.containers import Vertical, Center, Horizontal, VerticalScroll
+from textual.widget import Widget
+from textual.widgets import Button, Checkbox, DataTable, Input, Select, Static, TextArea
+from rich.text import Text
+
+class RenderedForm(VerticalScroll):
+
+    DEFAULT_CSS = """\
+RenderedForm {
+    keyline: heavy blue;
+}
+Vertical {
+    width: 1fr;
+    height: auto;
+}
+#form-title {
+    background: red;
+    height: 1;
+    margin: 1;
+}
+ChoiceWidget, StringInput, IntegerInput, #form-title {
+    padding: 0;
+}
+Static {
+    width: auto;
+}
+Center {
+    width: 1fr;
+}
+#buttons {
+    height: auto;
+    align: center middle;
+}
+TextWidget {
+    height: 6;
+}
+"""
+
+    # BaseForm.render creates every field's widget before rendering unless
+    # the rendered form creates them itself.
+    create_widgets = True
+
+    def __init__(
+        self,
+        form,
+        data: Optional[Dict[str, Any]] = None,
+        field_order: Optional[List[str]] = None,
+        id=None,
+    ):
+        super().__init__(*form.children, id=id, **form.kwargs)
+        self.form = form
+        self.fields = form.fields
+        self.data = data
+        self.field_order = field_order
+        self.record_stream: Optional[RecordStream] = None
+        self.journal: Optional[DraftJournal] = None
+        self._autosave_timer = None
+        self._compose_started: Optional[float] = None
+        if data is not None:
+            self.set_data(data)
+
+
+    def compose(self):
+        self._compose_started = time.perf_counter()
+        with instrumentation.span("compose", self.form):
+            yield from self.compose_title()
+            yield from self.compose_fields()
+            yield from self.compose_buttons()
+
+    def on_mount(self) -> None:
+        # The "mount" span runs from the start of composition until the
+        # form and its children are mounted.
+        if self._compose_started is not None:
+            instrumentation.record("mount", self._compose_started, self.form)
+            self._compose_started = None
+
+    def compose_title(self):
+        if self.form.title is not None:
+            yield Vertical(
+                Center(Static(f"---- {self.form.title} ----")), id="form-title"
+            )
+
+    def compose_fields(self):
+        for name, field in self.form.fields.items():
+            row = Vertical(field.widget)
+            row.display = not field.hidden
+            yield row
+
+    def compose_buttons(self):
+        yield Vertical(
+            Horizontal(
+                Button("Cancel", id="cancel"),
+                Button("Submit", id="submit"),
+                id="buttons"
+            ),
+            id="outer-buttons"
+        )
+
+
+    def get_data(self, include_hidden: bool = True) -> Dict[str, Any]:
+        return self.form.get_data(include_hidden)
+
+    def set_data(self, data: Dict[str, Any], validate: bool = True, reset: bool = False):
+        return self.form.set_data(data, validate, reset)
+
+    def stream(self, records: Records, sink: Sink, prefetch: int = 8) -> RecordStream:
+        """
+        Enter each record from records in turn, passing the results to sink
+        on submission instead of posting Form.Submitted. See RecordStream.
+        """
+        self.record_stream = RecordStream(self, records, sink, prefetch)
+        self.record_stream.start()
+        return self.record_stream
+
+    def rebind(self, form=None, data: Optional[Dict[str, Any]] = None, validate: bool = False):
+        """
+        Reuse this rendered form's widgets, in place, for another instance
+        of its form class and/or another record.
+
+        Fields are loaded from data, or reset to their defaults when data
+        does not mention them. Error messages are cleared (unless validate
+        is True, when the new values are validated), and the form is
+        scrolled to the top with its first field focused.
+        """
+        if form is not None and form is not self.form:
+            if list(form.fields) != list(self.fields):
+                raise ValueError("A rendered form can only be rebound to a form with the same fields")
+            for name, field in form.fields.items():
+                old_field = self.fields[name]
+                field.widget, old_field.widget = old_field.widget, None
+                if field.widget is not None:
+                    field.widget.field = field
+                field.errors = old_field.errors  # Still on display
+            self.form = form
+            self.fields = form.fields
+            form.rform = self
+        self.data = data
+        self.form.rule_errors.clear()
+        for field in self.fields.values():
+            field.show_errors([])
+            if field.widget is not None:
+                field.widget.remove_class("-invalid", "-valid")
+        self.form.set_data(data or {}, validate=validate, reset=True)
+        self.form.mark_clean()
+        self.scroll_home(animate=False)
+        for field in self.fields.values():
+            if field.widget is not None and field.widget.focusable:
+                field.widget.focus()
+                break
+
+    async def validate(self):
+        return await self.form.validate_async()
+
+    def autosave(self, path, interval: float = 1.0, compact_after: int = 200, restore: bool = True) -> DraftJournal:
+        """
+        Journal changes to the form's fields in a DraftJournal at path,
+        writing them at most once every interval seconds. With restore, any
+        draft already in the journal (say, from before a crash) is loaded
+        into the form first. The journal is cleared when the form is
+        submitted or cancelled.
+        """
+        self.journal = DraftJournal(path, interval, compact_after)
+        if restore and (data := self.journal.replay()):
+            self.set_data(data)
+        return self.journal
+
+    @on(Input.Changed)
+    @on(TextArea.Changed)
+    @on(Checkbox.Changed)
+    @on(Select.Changed)
+    @on(LargeSelectWidget.Changed)
+    def widget_changed(self, event) -> None:
+        field = getattr(event.control, "field", None)
+        if field is not None and self.fields.get(field.name) is field:
+            self.field_changed(field)
+
+    def field_changed(self, field: Field) -> None:
+        """
+        Called when the user changes the value of one of the form's fields.
+        """
+        self.form.update_modified([field.name])
+        self.form.update_visibility([field.name])
+        self.form.check_rules([field.name])
+        if self.journal is not None:
+            self.journal.mark(field.name)
+            if self._autosave_timer is None:
+                self._autosave_timer = self.set_timer(self.journal.interval, self.flush_journal)
+
+    def display_errors(self, field: Field, messages: List[str]) -> None:
+        """
+        Show messages as the errors of field, whose widget is mounted.
+        """
+        display_errors(field.widget.parent, messages)
+
+    def field_visibility_changed(self, field: Field) -> None:
+        """
+        Called when a field is hidden or shown. Its row stays mounted, and
+        is only taken out of the layout while hidden.
+        """
+        if field.widget is not None and field.widget.parent is not None:
+            field.widget.parent.display = not field.hidden
+
+    def flush_journal(self, wait: bool = False) -> None:
+        """
+        Write the values of the fields changed since the last flush to the
+        journal, in a worker thread unless wait is True.
+        """
+        self._autosave_timer = None
+        if self.journal is None:
+            return
+        values = {name: journal_value(self.fields[name].raw_value) for name in self.journal.take()}
+        if not values:
+            return
+        if wait:
+            self.journal.write(values)
+        else:
+            # Tagged with the generation, so a batch still being written
+            # when the journal is discarded doesn't bring it back.
+            self.run_worker(
+                partial(self.journal.write, values, self.journal.generation), thread=True, group="autosave"
+            )
+
+    def discard_journal(self) -> None:
+        if self._autosave_timer is not None:
+            self._autosave_timer.stop()
+            self._autosave_timer = None
+        if self.journal is not None:
+            self.journal.clear()
+
+    def on_unmount(self) -> None:
+        self.flush_journal(wait=True)
+
+    @on(Button.Pressed, "#submit")
+    async def submit_pressed(self, event: Button.Pressed) -> None:
+        """
+        When form is submitted, validate it and if successful post a Submitted
+        message, or when streaming records pass the data on and load the next.
+        """
+        if await self.validate():
+            if self.record_stream is not None:
+                try:
+                    if await self.record_stream.submit():
+                        self.discard_journal()
+                except Exception as error:
+                    self.app.notify(f"The record could not be saved: {error}", severity="error")
+            else:
+                self.discard_journal()
+                self.post_message(Form.Submitted(self))
+        else:
+            self.app.notify("Please fix the issues before submitting")
+
+    @on(Button.Pressed, "#cancel")
+    async def cancel_pressed(self, event: Button.Pressed) -> None:
+        """
+        When form is cancelled qpost a Cancelled message.
+        """
+        self.discard_journal()
+        self.post_message(Form.Cancelled(self))
+
+
+class CompactRenderedForm(RenderedForm, inherit_css=False):
+    """
+    A RenderedForm laid out as a single grid, with a row for each field of
+    label, widget and error cells, so that the widget tree is just one
+    level deep and there is no container to lay out and style per field.
+    It doesn't inherit RenderedForm's CSS (so re-declares the scrolling it
+    needs), and its own CSS only applies to its own children.
+
+    Use it by passing render_type=CompactRenderedForm to the form.
+    """
+
+    DEFAULT_CSS = """\
+CompactRenderedForm {
+    height: 1fr;
+    overflow-x: hidden;
+    overflow-y: auto;
+    layout: grid;
+    grid-size: 3;
+    grid-columns: auto 1fr auto;
+    grid-rows: auto;
+    grid-gutter: 0 1;
+}
+CompactRenderedForm > .form-title {
+    column-span: 3;
+    width: 1fr;
+    text-align: center;
+    background: $primary;
+}
+CompactRenderedForm > .form-label {
+    height: 3;
+    content-align: left middle;
+}
+CompactRenderedForm > ErrorDisplay {
+    width: auto;
+    max-width: 40;
+    text-align: left;
+}
+CompactRenderedForm > ErrorDisplay.-empty {
+    display: block;
+}
+CompactRenderedForm > .form-buttons {
+    column-span: 3;
+    height: auto;
+    align: center middle;
+}
+"""
+
+    def __init__(self, form, **kwargs):
+        super().__init__(form, **kwargs)
+        self._cells: Dict[str, Tuple[Static, ErrorDisplay]] = {}
+
+    def compose_title(self):
+        if self.form.title is not None:
+            yield Static(self.form.title, classes="form-title")
+
+    def compose_fields(self):
+        for name, field in self.fields.items():
+            label = Static("" if field.widget_shows_label else field.label, classes="form-label")
+            errors = ErrorDisplay(field.errors)
+            self._cells[name] = (label, errors)
+            for cell in (label, field.widget, errors):
+                cell.display = not field.hidden
+                yield cell
+
+    def compose_buttons(self):
+        yield Horizontal(
+            Button("Cancel", id="cancel"),
+            Button("Submit", id="submit"),
+            id="buttons",
+            classes="form-buttons",
+        )
+
+    def display_errors(self, field: Field, messages: List[str]) -> None:
+        self._cells[field.name][1].show(messages)
+
+    def field_visibility_changed(self, field: Field) -> None:
+        if field.name in self._cells:
+            for cell in (*self._cells[field.name], field.widget):
+                cell.display = not field.hidden
+
+
+class VirtualRow(Vertical):
+    """
+    A mounted field in a VirtualRenderedForm, which reports its height
+    so the form can replace its estimate.
+    """
+    def __init__(self, index: int, *children, **kwargs):
+        super().__init__(*children, **kwargs)
+        self.index = index
+
+    def on_resize(self) -> None:
+        if isinstance(self.parent, VirtualRenderedForm):
+            height = self.outer_size.height + self.styles.margin.bottom
+            self.parent.row_resized(self.index, height)
+
+
+class VirtualRenderedForm(RenderedForm):
+    """
+    A RenderedForm that only mounts the widgets of fields in or near the
+    viewport, so very large forms mount quickly and hold only a screenful
+    of widgets in the DOM.
+
+    Off-screen fields keep their values (and any validation messages) in
+    their Field. Spacers above and below the mounted rows stand in for the
+    rest, using estimated row heights that are corrected as rows are
+    measured. Rows are mounted and unmounted as the form scrolls, which
+    includes scrolling a newly-focused field into view as the user tabs.
+
+    Use it by passing render_type=VirtualRenderedForm to the form.
+    """
+
+    DEFAULT_CSS = """\
+VirtualRenderedForm > VirtualRow {
+    height: auto;
+    margin: 0;
+    padding: 0 0 1 0;
+}
+VirtualRenderedForm > .virtual-spacer {
+    width: 1fr;
+    height: 0;
+}
+"""
+
+    create_widgets = False
+    overscan = 5  # rows mounted beyond each edge of the viewport
+    estimated_height = 4
+    estimated_heights = {TextField: 7, LargeTextField: 7}
+
+    def __init__(self, form, **kwargs):
+        super().__init__(form, **kwargs)
+        self._fields = list(self.fields.values())
+        self._positions = {field.name: index for index, field in enumerate(self._fields)}
+        self._heights = [self.estimate_height(field) for field in self._fields]
+        self._offsets = list(accumulate(self._heights, initial=0))
+        self._rows: Dict[int, VirtualRow] = {}
+        self._remeasure_pending = False
+        self._top_spacer = Widget(classes="virtual-spacer")
+        self._bottom_spacer = Widget(classes="virtual-spacer")
+
+    def rebind(self, form=None, data: Optional[Dict[str, Any]] = None, validate: bool = False):
+        if form is not None and form is not self.form:
+            self._fields = list(form.fields.values())
+        super().rebind(form, data, validate)
+
+    def estimate_height(self, field: Field) -> int:
+        if field.hidden:
+            return 0
+        return self.estimated_heights.get(type(field), self.estimated_height)
+
+    def field_visibility_changed(self, field: Field) -> None:
+        super().field_visibility_changed(field)
+        if getattr(self, "_heights", None) is None:
+            return  # Still being constructed, with heights yet to be estimated
+        index = self._positions[field.name]
+        self._heights[index] = self.estimate_height(field)
+        if not self._remeasure_pending:
+            self._remeasure_pending = True
+            self.call_after_refresh(self._remeasure)
+
+    def compose_fields(self):
+        self._bottom_spacer.styles.height = self._offsets[-1]
+        yield self._top_spacer
+        yield self._bottom_spacer
+
+    def on_mount(self) -> None:
+        super().on_mount()
+        self.call_after_refresh(self.update_window)
+
+    def on_resize(self) -> None:
+        self.update_window()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if round(old_value) != round(new_value):
+            self.update_window()
+
+    def visible_range(self) -> range:
+        """
+        The indexes of the fields that should currently be mounted.
+        """
+        top = self.scroll_y - self._top_spacer.virtual_region.y
+        bottom = top + self.scrollable_content_region.height
+        start = bisect_right(self._offsets, top) - 1 - self.overscan
+        stop = bisect_left(self._offsets, bottom) + self.overscan
+        return range(max(start, 0), min(stop, len(self._fields)))
+
+    def update_window(self) -> None:
+        """
+        Mount the rows that have come into range and unmount those that
+        have left it.
+        """
+        if not self.is_mounted:
+            return
+        window = self.visible_range()
+        removed = [i for i in self._rows if i not in window]
+        for index in removed:
+            self._fields[index].detach_widget()
+            self._rows.pop(index).remove()
+        instrumentation.count("removed", len(removed))
+        added = [i for i in window if i not in self._rows]
+        instrumentation.count("mounted", len(added))
+        if added:
+            first_kept = min(self._rows, default=window.stop)
+            above = [self._make_row(i) for i in added if i < first_kept]
+            below = [self._make_row(i) for i in added if i > first_kept]
+            if above:
+                self.mount(*above, after=self._top_spacer)
+            if below:
+                self.mount(*below, before=self._bottom_spacer)
+        self._place_spacers(window)
+
+    def _make_row(self, index: int) -> VirtualRow:
+        field = self._fields[index]
+        widget = field.attach_widget(field.timed_create_widget())
+        row = VirtualRow(
+            index,
+            widget,
+            *([ErrorDisplay(field.errors)] if field.errors else []),
+        )
+        row.display = not field.hidden
+        self._rows[index] = row
+        return row
+
+    def _place_spacers(self, window: range) -> None:
+        self._top_spacer.styles.height = self._offsets[window.start]
+        self._bottom_spacer.styles.height = self._offsets[-1] - self._offsets[window.stop]
+
+    def row_resized(self, index: int, height: int) -> None:
+        """
+        Replace a row's estimated height with its measured one.
+        """
+        if height and height != self._heights[index]:
+            self._heights[index] = height
+            if not self._remeasure_pending:
+                self._remeasure_pending = True
+                self.call_after_refresh(self._remeasure)
+
+    def _remeasure(self) -> None:
+        self._remeasure_pending = False
+        self._offsets = list(accumulate(self._heights, initial=0))
+        self.update_window()
+
+
+class WizardRenderedForm(RenderedForm):
+    """
+    A RenderedForm that shows its fields a page at a time, with Back and
+    Next buttons. Each page's widgets are only created and mounted when
+    the page is first visited, so the time until the form can be used
+    depends on the size of its first page, not of the whole form.
+
+    The pages are given by the form's pages attribute, a list of lists of
+    field names (any fields left out make a last page), or failing that
+    by splitting the fields into pages of page_size. Next only validates
+    the fields on the current page; Submit, on the last page, validates
+    them all and turns to the first page with errors. Pages that have
+    been left are hidden with their widgets intact or, when keep_pages is
+    False, unmounted, with their fields remembering the values.
+
+    Use it by passing render_type=WizardRenderedForm to the form.
+    """
+
+    create_widgets = False
+    page_size = 10
+    keep_pages = True
+
+    def __init__(self, form, **kwargs):
+        super().__init__(form, **kwargs)
+        self.pages = self.paginate()
+        self.page_index = 0
+        self._page_widgets: Dict[int, Vertical] = {}
+
+    def paginate(self) -> List[List[str]]:
+        """
+        The names of the fields on each page.
+        """
+        names = list(self.fields)
+        if self.form.pages is None:
+            pages = [names[i:i + self.page_size] for i in range(0, len(names), self.page_size)]
+        else:
+            pages = [[name for name in page if name in self.fields] for page in self.form.pages]
+            placed = {name for page in pages for name in page}
+            pages.append([name for name in names if name not in placed])
+        return [page for page in pages if page] or [[]]
+
+    def rebind(self, form=None, data: Optional[Dict[str, Any]] = None, validate: bool = False):
+        super().rebind(form, data, validate)
+        self.show_page(0)
+
+    def compose_fields(self):
+        yield self._make_page(0)
+
+    def compose_buttons(self):
+        yield Vertical(
+            Horizontal(
+                Button("Cancel", id="cancel"),
+                Button("Back", id="back"),
+                Button("Next", id="next"),
+                Button("Submit", id="submit"),
+                id="buttons"
+            ),
+            id="outer-buttons"
+        )
+
+    def on_mount(self) -> None:
+        super().on_mount()
+        self.update_buttons()
+
+    def _make_page(self, index: int) -> Vertical:
+        rows = []
+        for name in self.pages[index]:
+            field = self.fields[name]
+            widget = field.attach_widget(field.timed_create_widget())
+            row = Vertical(widget, *([ErrorDisplay(field.errors)] if field.errors else []))
+            row.display = not field.hidden
+            rows.append(row)
+        page = Vertical(*rows, classes="wizard-page")
+        self._page_widgets[index] = page
+        return page
+
+    def show_page(self, index: int) -> None:
+        """
+        Turn to the page at index, mounting it if it has not been visited.
+        """
+        if index not in self._page_widgets:
+            self.mount(self._make_page(index), before="#outer-buttons")
+            instrumentation.count("mounted")
+        for i in [i for i in self._page_widgets if i != index]:
+            if self.keep_pages:
+                self._page_widgets[i].display = False
+            else:
+                for name in self.pages[i]:
+                    self.fields[name].detach_widget()
+                self._page_widgets.pop(i).remove()
+                instrumentation.count("removed")
+        page = self._page_widgets[index]
+        page.display = True
+        self.page_index = index
+        self.update_buttons()
+        self.scroll_home(animate=False)
+        self.call_after_refresh(self._focus_page)
+
+    def _focus_page(self) -> None:
+        for name in self.pages[self.page_index]:
+            widget = self.fields[name].widget
+            if widget is not None and widget.focusable:
+                widget.focus()
+                break
+
+    def update_buttons(self) -> None:
+        last = self.page_index == len(self.pages) - 1
+        self.query_one("#back").display = self.page_index > 0
+        self.query_one("#next").display = not last
+        self.query_one("#submit").display = last
+
+    async def validate_page(self) -> bool:
+        """
+        Validate the fields on the current page.
+        """
+        names = self.pages[self.page_index]
+        fields = [self.fields[name] for name in names if not self.fields[name].hidden]
+        results = await asyncio.gather(*(field.validate_async() for field in fields))
+        for field, messages in zip(fields, results):
+            field.show_errors(messages)
+        self.form.check_rules(names)
+        return not any(field.errors for field in fields)
+
+    async def validate(self):
+        if await super().validate():
+            return True
+        for index, page in enumerate(self.pages):
+            if any(self.fields[name].errors for name in page):
+                self.show_page(index)
+                break
+        return False
+
+    @on(Button.Pressed, "#next")
+    async def next_pressed(self, event: Button.Pressed) -> None:
+        if await self.validate_page():
+            self.show_page(self.page_index + 1)
+        else:
+            self.app.notify("Please fix the issues before continuing")
+
+    @on(Button.Pressed, "#back")
+    def back_pressed(self, event: Button.Pressed) -> None:
+        self.show_page(self.page_index - 1)
+
+
+class RenderedFormSet(Vertical):
+    """
+    A FormSet shown as a DataTable, which only renders the rows in view,
+    above a single row of real field widgets for editing the row under
+    the table's cursor. The editor is an instance of the formset's form
+    class, rendered by this widget rather than a RenderedForm. Edits are
+    written to the formset's rows as they are made, and the row is
+    validated each time. Press Enter on a row to edit it, and Escape to
+    return to the table.
+    """
+
+    DEFAULT_CSS = """\
+RenderedFormSet {
+    height: 1fr;
+}
+RenderedFormSet > DataTable {
+    height: 1fr;
+}
+RenderedFormSet > .formset-editor {
+    height: auto;
+}
+RenderedFormSet > .formset-editor > * {
+    height: 3;
+}
+"""
+
+    BINDINGS = [("escape", "focus_table", "Back to the rows")]
+
+    column_width = 16
+    column_widths = {BooleanField: 6, IntegerField: 10}
+
+    def __init__(self, formset, id=None):
+        super().__init__(id=id)
+        self.formset = formset
+        self.form = formset.form_class()
+        self.form.rform = self
+        self.fields = self.form.fields
+        self.row_index: Optional[int] = None  # The row in the editor
+        self.table = DataTable(cursor_type="row", zebra_stripes=True)
+        self.error_display = ErrorDisplay()
+        self._field_errors: Dict[str, List[str]] = {}
+
+    def width_of(self, field: Field) -> int:
+        return self.column_widths.get(type(field), self.column_width)
+
+    def compose(self):
+        yield self.table
+        padding = 2 * self.table.cell_padding
+        with Horizontal(classes="formset-editor"):
+            for field in self.fields.values():
+                widget = field.attach_widget(field.timed_create_widget())
+                widget.styles.width = self.width_of(field) + padding
+                yield widget
+        yield self.error_display
+
+    def on_mount(self) -> None:
+        for name, field in self.fields.items():
+            self.table.add_column(field.label or name, width=self.width_of(field))
+        self.call_after_refresh(self.reload)  # Once mounted, so rows load with change events suppressed
+
+    def cells(self, index: int) -> List[Any]:
+        row = self.formset.rows[index]
+        errors = self.formset.errors.get(index, {})
+        return [
+            Text(field.display_value(row.get(name)), style="bold red") if name in errors
+            else field.display_value(row.get(name))
+            for name, field in self.fields.items()
+        ]
+
+    def reload(self) -> None:
+        """
+        Show the formset's rows afresh, keeping the cursor where it was.
+        """
+        if not self.is_mounted:
+            return
+        cursor_row = self.table.cursor_row
+        self.table.clear()
+        self.table.add_rows(self.cells(index) for index in range(len(self.formset.rows)))
+        self.row_index = None
+        if self.formset.rows:
+            self.table.move_cursor(row=min(cursor_row, len(self.formset.rows) - 1))
+            self.edit_row(self.table.cursor_row)
+
+    def update_row(self, index: int) -> None:
+        for column, cell in enumerate(self.cells(index)):
+            self.table.update_cell_at((index, column), cell)
+
+    def edit_row(self, index: int) -> None:
+        """
+        Load a row into the editor.
+        """
+        self.row_index = index
+        self.form.set_data(self.formset.rows[index], validate=False, reset=True)
+        self.show_row_errors()
+
+    def show_row_errors(self) -> None:
+        errors = self.formset.errors.get(self.row_index, {})
+        self.form.rule_errors.clear()  # Included in errors
+        for name, field in self.fields.items():
+            field.show_errors(errors.get(name, []))
+
+    def display_errors(self, field: Field, messages: List[str]) -> None:
+        """
+        Show messages as the errors of field in the editor, beneath it
+        with the other fields' errors.
+        """
+        self._field_errors[field.name] = messages
+        self.error_display.show([
+            f"{field.label or name}: {message}"
+            for name, field in self.fields.items()
+            for message in self._field_errors.get(name, ())
+        ])
+
+    def field_visibility_changed(self, field: Field) -> None:
+        # Hidden fields keep their place, so the editor stays in line with the table.
+        if field.widget is not None:
+            field.widget.visible = not field.hidden
+
+    @on(DataTable.RowHighlighted)
+    def row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        if event.cursor_row != self.row_index and event.cursor_row < len(self.formset.rows):
+            self.edit_row(event.cursor_row)
+
+    @on(DataTable.RowSelected)
+    def row_selected(self, event: DataTable.RowSelected) -> None:
+        for field in self.fields.values():
+            if field.widget.focusable and not field.hidden:
+                field.widget.focus()
+                break
+
+    def action_focus_table(self) -> None:
+        self.table.focus()
+
+    @on(Input.Changed)
+    @on(TextArea.Changed)
+    @on(Checkbox.Changed)
+    @on(Select.Changed)
+    @on(LargeSelectWidget.Changed)
+    def widget_changed(self, event) -> None:
+        field = getattr(event.control, "field", None)
+        if field is None or self.fields.get(field.name) is not field or self.row_index is None:
+            return
+        index = self.row_index
+        self.formset.rows[index][field.name] = field.data_value()
+        self.form.update_visibility([field.name])
+        self.formset.validate_row(index)
+        self.update_row(index)
+        self.show_row_errors()
@@ -0,0 +1,100 @@
+# stream.py
+import asyncio
+import inspect
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, Optional, Union
+
+from textual.message import Message
+
+Records = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+Sink = Callable[[Dict[str, Any], Dict[str, Any]], Any]
+
+_END = object()
+
+
+class RecordStream:
+    """
+    Drive a rendered form through a stream of records, for data entry
+    from long queues of work.
+
+    Records come from a sync or async iterable of dicts and are fetched
+    in the background, at most prefetch records ahead of the one being
+    edited, so memory use is bounded however long the stream is. Each
+    record is loaded into the form's existing widgets. When the form is
+    submitted, sink is called with the record and the form's data, and
+    the next record is loaded. Sync sources and sinks run in a worker
+    thread so they cannot block the event loop; sinks may also be
+    coroutine functions. Once the stream is exhausted a
+    RecordStream.Finished message is posted from the form.
+
+    Create one with RenderedForm.stream once the form is mounted.
+    """
+
+    class Finished(Message):
+        def __init__(self, stream: "RecordStream"):
+            super().__init__()
+            self.stream = stream
+
+    def __init__(self, rform, records: Records, sink: Sink, prefetch: int = 8):
+        self.rform = rform
+        self.records = records
+        self.sink = sink
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+        self.current: Optional[Dict[str, Any]] = None
+        self.count = 0
+        self.finished = False
+
+    def start(self):
+        self.rform.run_worker(self._prefetch(), group="record-stream")
+        self.rform.run_worker(self.next_record(), group="record-stream")
+
+    async def _prefetch(self):
+        if hasattr(self.records, "__aiter__"):
+            async for record in self.records:
+                await self.queue.put(record)
+        else:
+            iterator = iter(self.records)
+            while (record := await asyncio.to_thread(next, iterator, _END)) is not _END:
+                await self.queue.put(record)
+        await self.queue.put(_END)
+
+    async def next_record(self):
+        """
+        Load the next record into the form, or finish the stream.
+        """
+        record = await self.queue.get()
+        if record is _END:
+            self.current = None
+            self.finished = True
+            self.rform.post_message(self.Finished(self))
+            return
+        self.current = record
+        self.rform.rebind(data=record)
+
+    async def submit(self) -> bool:
+        """
+        Pass the current record and the form's data to the sink, then move
+        on to the next record, returning whether there was a record to
+        submit. Nothing happens while the next record is still on its way.
+        If the sink raises, the record stays loaded and the exception is
+        passed on.
+        """
+        record = self.current
+        if self.finished or record is None:
+            return False
+        # Until the next record is loaded, further submits are ignored, so
+        # next_record is the queue's only reader.
+        self.current = None
+        data = self.rform.get_data()
+        try:
+            if inspect.iscoroutinefunction(self.sink):
+                await self.sink(record, data)
+            else:
+                result = await asyncio.to_thread(self.sink, record, data)
+                if inspect.isawaitable(result):
+                    await result
+        except BaseException:
+            self.current = record
+            raise
+        self.count += 1
+        await self.next_record()
+        return True
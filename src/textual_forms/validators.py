@@ -1,5 +1,114 @@
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
 from textual.validation import Validator, ValidationResult
-from textual.widgets import Select
+
+
+def failure_messages(vr: Optional[ValidationResult]) -> List[str]:
+    if vr is None or vr.is_valid:
+        return []
+    return list(vr.failure_descriptions)
+
+
+class AsyncValidator(Validator):
+    """
+    A validator whose check is a coroutine, for checks that would otherwise
+    block the event loop (database lookups, remote services). Forms run
+    async validators concurrently, after the field's other validators pass.
+    """
+    def validate(self, value: str) -> ValidationResult:
+        return self.success()  # The real check is validate_async
+
+    async def validate_async(self, value: str) -> ValidationResult:
+        raise NotImplementedError("Async validators must implement validate_async()")
+
+
+class ThreadedValidator(AsyncValidator):
+    """
+    Run a synchronous validator in a worker thread, for expensive checks
+    such as heavy regular expressions.
+    """
+    def __init__(self, validator: Validator, failure_description=None):
+        super().__init__(failure_description)
+        self.validator = validator
+
+    async def validate_async(self, value: str) -> ValidationResult:
+        return await asyncio.to_thread(self.validator.validate, value)
+
+
+class FormValidator(Validator):
+    """
+    A validator across several of a form's fields, declared in the form's
+    class body alongside them. fields names the fields it reads: the form
+    re-evaluates it whenever one of them changes, and shows its failure
+    messages with the fields named in report_to (by default, the last of
+    fields). validate is passed a dict of the fields' values.
+    """
+    def __init__(self, fields: Sequence[str], report_to: Optional[Sequence[str]] = None, failure_description=None):
+        super().__init__(failure_description)
+        self.fields = tuple(fields)
+        self.report_to = tuple(report_to) if report_to is not None else self.fields[-1:]
+        self.name = ""
+
+    def validate(self, values: Dict[str, Any]) -> ValidationResult:
+        raise NotImplementedError("Form validators must implement validate()")
+
+
+class FormFunction(FormValidator):
+    """
+    A FormValidator that passes the fields' values as keyword arguments to
+    function, which returns whether they are valid together. The rule
+    passes while any of the fields is empty, or holds a value function
+    can't handle, leaving those to the fields' own validators.
+    """
+    def __init__(
+        self,
+        fields: Sequence[str],
+        function: Callable[..., bool],
+        failure_description=None,
+        report_to: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(fields, report_to, failure_description)
+        self.function = function
+
+    def validate(self, values: Dict[str, Any]) -> ValidationResult:
+        if any(value is None or value == "" for value in values.values()):
+            return self.success()
+        try:
+            valid = self.function(**values)
+        except (TypeError, ValueError):
+            return self.success()  # Handled by other validators
+        return self.success() if valid else self.failure()
+
+
+class LineValidator(Validator):
+    """
+    A validator that checks a text one line at a time, so that a
+    LargeTextField need only re-check the lines changed since it was last
+    validated. Subclasses implement check_line, returning whether a single
+    line (without its newline) is valid.
+    """
+    def check_line(self, line: str) -> bool:
+        raise NotImplementedError("Line validators must implement check_line()")
+
+    def validate(self, value: str) -> ValidationResult:
+        if all(self.check_line(line) for line in value.splitlines()):
+            return self.success()
+        return self.failure()
+
+
+class LineFunction(LineValidator):
+    """
+    A LineValidator that passes each line to function, which returns
+    whether it is valid.
+    """
+    def __init__(self, function: Callable[[str], bool], failure_description=None):
+        super().__init__(failure_description)
+        self.function = function
+
+    def check_line(self, line: str) -> bool:
+        return self.function(line)
+
 
 class EvenInteger(Validator):
     def validate(self, value: str) -> ValidationResult:
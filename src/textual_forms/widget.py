@@ -1,10 +1,20 @@
 # widget.py
-from typing import List
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence, Tuple
 
-from textual.widgets import Input, Checkbox, Select, Static, TextArea
-from textual.containers import Center
+from textual import on
+from textual.widgets import Input, Checkbox, OptionList, Select, TextArea
+from textual.widgets.option_list import Option
+from textual.containers import Vertical
+from textual.message import Message
+from textual.reactive import var
+from textual.widget import Widget
 from textual.validation import ValidationResult, Validator
 
+from .instrument import instrumentation
+from .validators import AsyncValidator, LineValidator, failure_messages
+
 def widget_num():
     count = 0
     while True:
@@ -13,32 +23,152 @@ def widget_num():
 
 widget_num = widget_num()
 
+
+@contextmanager
+def changes_suppressed(node, widgets):
+    """
+    Change the values of widgets in a single batched update, without posting
+    their change events or running the validation each Input would
+    otherwise run on every change.
+    """
+    # Inputs may share one validate_on set (Textual's default), so each gets
+    # a copy without "changed" rather than having the set edited in place.
+    inputs = [(w, w.validate_on) for w in widgets if isinstance(w, Input) and "changed" in w.validate_on]
+    for widget, validate_on in inputs:
+        widget.validate_on = validate_on - {"changed"}
+    try:
+        with node.app.batch_update(), node.prevent(*CHANGE_EVENTS):
+            yield
+    finally:
+        for widget, validate_on in inputs:
+            widget.validate_on = validate_on
+
 class Succeed(Validator):
     def validate(self, value):
         return self.success()
 
+class ErrorDisplay(Widget):
+    """
+    A field's error messages, one per line. The display is updated in
+    place as the messages change, and hidden while there are none.
+    """
+
+    DEFAULT_CSS = """\
+ErrorDisplay {
+    width: 1fr;
+    height: auto;
+    text-align: center;
+}
+ErrorDisplay.-empty {
+    display: none;
+}
+"""
+
+    def __init__(self, messages: List[str] = (), **kwargs):
+        super().__init__(classes="erm", **kwargs)
+        self.show(messages)
+
+    def show(self, messages: List[str]):
+        self.messages = list(messages)
+        self.set_class(not self.messages, "-empty")
+        self.refresh(layout=True)
+
+    def render(self) -> str:
+        return "\n".join(self.messages)
+
+def display_errors(container, messages: List[str]):
+    """
+    Show messages in the ErrorDisplay in container (a field's row), which
+    is only mounted the first time the field has errors to show.
+    """
+    for child in container.children:
+        if isinstance(child, ErrorDisplay):
+            child.show(messages)
+            return
+    if messages:
+        instrumentation.count("mounted")
+        container.mount(ErrorDisplay(messages))
+
+
+class TimedValidator(Validator):
+    """
+    Run a widget's validator inside a "validator" instrumentation span.
+    """
+    def __init__(self, validator: Validator, field: "Field"):  # Forward reference
+        super().__init__(validator.failure_description)
+        self.validator = validator
+        self.field = field
+
+    def validate(self, value) -> ValidationResult:
+        with instrumentation.span("validator", field=self.field, validator=self.validator):
+            return self.validator.validate(value)
+
+def timed_validators(field: "Field", validators: List[Validator]) -> List[Validator]:
+    # Async validators' synchronous validate does nothing, so isn't worth timing.
+    return [v if isinstance(v, AsyncValidator) else TimedValidator(v, field) for v in validators]
+
+
 class InputWidget:
     """
     Mixin to provide requirements for forms support.
+
+    When the field has a validation_delay, live validation waits until
+    typing has paused for that many seconds rather than running on every
+    change.
     """
-    async def on_input_changed(self, e):
-        container = self.parent
-        await container.remove_children(".erm")
-        if (vr := e.validation_result) is not None and not vr.is_valid:
-            for msg in vr.failure_descriptions:
-                container.mount(Center(Static(msg), classes="erm"))
+    _validation_timer = None
+
+    def live_validate_on(self, kwargs):
+        # Input validates on every change unless told otherwise; a delayed
+        # field validates from its timer instead.
+        if self.field.validation_delay:
+            kwargs.setdefault("validate_on", ["blur", "submitted"])
+        return kwargs
+
+    def on_input_changed(self, e):
+        if not self.field.validation_delay:
+            self.show_validation(e.validation_result)
+            return
+        if self._validation_timer is not None:
+            self._validation_timer.stop()
+        self._validation_timer = self.set_timer(self.field.validation_delay, self._delayed_validation)
+
+    def _delayed_validation(self):
+        self._validation_timer = None
+        self.show_validation(self.validate(self.value))
+
+    def show_validation(self, vr):
+        """
+        Show the outcome of the synchronous validators and, if they passed,
+        start the field's async validators. A newer value cancels any async
+        validation still running for an older one.
+        """
+        self.workers.cancel_group(self, "validation")
+        messages = failure_messages(vr)
+        if messages or not self.field.async_validators:
+            self.field.record_validation(self.value, messages)
+            self.field.show_errors(messages)
+        else:
+            self.run_worker(self._validate_async(self.value), group="validation", exclusive=True)
+
+    async def _validate_async(self, value):
+        messages = await self.field.run_async_validators(value)
+        self.field.record_validation(value, messages)
+        self.field.show_errors(messages)
 
 
 class StringWidget(Input, InputWidget):
     def __init__(self, field: "Field", **kwargs):  # Forward reference
-        super().__init__(select_on_focus=False, **kwargs)
         self.field = field
+        super().__init__(select_on_focus=False, **self.live_validate_on(kwargs))
+        self.validators = timed_validators(field, self.validators)
 
 
 class IntegerWidget(Input, InputWidget):
     def __init__(self, field: "Field",  **kwargs): # Forward reference
-        super().__init__(type='integer', select_on_focus=False, **kwargs)
         self.field = field
+        super().__init__(type='integer', select_on_focus=False, **self.live_validate_on(kwargs))
+        self.validators = timed_validators(field, self.validators)
 
 
 class TextWidget(TextArea, InputWidget):
@@ -55,6 +185,150 @@ class TextWidget(TextArea, InputWidget):
         return ValidationResult()
 
 
+class LargeTextWidget(TextWidget):
+    """
+    A TextWidget for very large documents. Its edits are tracked as they
+    are made, so its size, whether it has changed and the validity of its
+    lines are all known without joining the document into one string.
+    That only happens when its value is read, and then at most once for
+    each version of the text.
+
+    version counts the changes to the text. Undoing or redoing an edit,
+    or replacing the whole text, counts as changing every line.
+    """
+    def __init__(self, field: "Field", **kwargs):  # Forward reference
+        self.version = 0
+        self._length: Optional[int] = None  # Counted when first needed
+        self._text: Optional[Tuple[int, str]] = None  # (version, text)
+        self._line_failures: Optional[List[Optional[Tuple[str, ...]]]] = None  # Per line, None until checked
+        self._failure_counts: Counter = Counter()
+        self._unchecked: Optional[Tuple[int, int]] = None  # The span of rows that may hold unchecked lines
+        super().__init__(field, **kwargs)
+
+    @property
+    def value(self):
+        if self._text is None or self._text[0] != self.version:
+            self._text = (self.version, self.text)
+        return self._text[1]
+
+    @value.setter
+    def value(self, v):
+        self.text = v
+
+    @property
+    def length(self) -> int:
+        """
+        The length of the text, newlines included.
+        """
+        if self._length is None:
+            lines = self.document.lines
+            self._length = sum(map(len, lines)) + len(self.document.newline) * (len(lines) - 1)
+        return self._length
+
+    @property
+    def line_count(self) -> int:
+        return self.document.line_count
+
+    def chunks(self, size: int = 65536) -> Iterator[str]:
+        """
+        The text in successive pieces of size characters (the last may be
+        shorter), built a few lines at a time.
+        """
+        lines = self.document.lines
+        newline = self.document.newline
+        last = len(lines) - 1
+        pending: List[str] = []
+        length = 0
+        for row, line in enumerate(lines):
+            pending.append(line if row == last else line + newline)
+            length += len(pending[-1])
+            if length >= size:
+                text = "".join(pending)
+                cut = length - length % size
+                for start in range(0, cut, size):
+                    yield text[start:start + size]
+                pending, length = [text[cut:]], length - cut
+        if length:
+            yield "".join(pending)
+
+    def _span_length(self, top, end) -> int:
+        lines = self.document.lines
+        (top_row, top_column), (end_row, end_column) = top, end
+        if top_row == end_row:
+            return end_column - top_column
+        newline = len(self.document.newline)
+        middle = sum(len(lines[row]) + newline for row in range(top_row + 1, end_row))
+        return len(lines[top_row]) - top_column + newline + middle + end_column
+
+    def edit(self, edit):
+        top_row, old_bottom_row = edit.top[0], edit.bottom[0]
+        result = super().edit(edit)
+        self.version += 1
+        end_row = result.end_location[0]
+        if self._length is not None:
+            self._length += self._span_length(edit.top, result.end_location) - len(result.replaced_text)
+        if self._line_failures is not None:
+            # The edited lines are replaced by unchecked ones.
+            for failures in self._line_failures[top_row:old_bottom_row + 1]:
+                if failures:
+                    self._failure_counts.subtract(failures)
+            self._line_failures[top_row:old_bottom_row + 1] = [None] * (end_row - top_row + 1)
+            self._unchecked = self._moved_span(self._unchecked, top_row, old_bottom_row, end_row)
+        return result
+
+    @staticmethod
+    def _moved_span(span, top_row, old_bottom_row, end_row):
+        # Where span, a (start, stop) range of rows, ends up once rows
+        # top_row to old_bottom_row are replaced by rows top_row to end_row,
+        # widened to include the replacements.
+        if span is None:
+            return top_row, end_row + 1
+        shift = end_row - old_bottom_row
+        start, last = span[0], span[1] - 1
+        start = start + shift if start > old_bottom_row else min(start, top_row)
+        last = last + shift if last > old_bottom_row else (end_row if last >= top_row else last)
+        return min(start, top_row), max(last, end_row) + 1
+
+    def _changed_throughout(self):
+        self.version += 1
+        self._length = None
+        self._line_failures = None
+
+    def load_text(self, text: str) -> None:
+        super().load_text(text)
+        self._changed_throughout()
+
+    def undo(self) -> None:
+        super().undo()
+        self._changed_throughout()
+
+    def redo(self) -> None:
+        super().redo()
+        self._changed_throughout()
+
+    def check_lines(self, validators: Sequence[LineValidator]) -> List[str]:
+        """
+        The failure descriptions of the line validators that fail for any
+        line of the text, checking only the lines not checked since they
+        were last changed. validators must be the same on every call.
+        """
+        lines = self.document.lines
+        if self._line_failures is None:
+            self._line_failures = [None] * len(lines)
+            self._failure_counts = Counter()
+            self._unchecked = (0, len(lines))
+        line_failures = self._line_failures
+        if self._unchecked is not None:
+            start, stop = self._unchecked
+            for row in range(start, min(stop, len(lines))):
+                if line_failures[row] is None:
+                    failures = tuple(v.failure_description for v in validators if not v.check_line(lines[row]))
+                    line_failures[row] = failures
+                    self._failure_counts.update(failures)
+            self._unchecked = None
+        return [v.failure_description for v in validators if self._failure_counts[v.failure_description] > 0]
+
+
 class CheckboxWidget(Checkbox):
     def __init__(self, field: "Field", **kwargs): # Forward reference
         super().__init__(**kwargs)
@@ -70,7 +344,105 @@ class SelectWidget(Select):
         self.required = required
 
     def validate(self, value):
-        if value != Select.BLANK or not self.required:
+        if (value is not None and value != Select.BLANK) or not self.required:
             return Succeed().success()
         else:
-            return Succeed().failure("A value is required")
\ No newline at end of file
+            return Succeed().failure("A value is required")
+
+class LargeSelectWidget(Vertical):
+    """
+    A type-ahead alternative to Select for very large option sets. Typing
+    in the input searches the field's ChoiceIndex, and only the best
+    matches are ever put in the option list.
+    """
+
+    DEFAULT_CSS = """\
+LargeSelectWidget {
+    height: auto;
+}
+LargeSelectWidget > OptionList {
+    max-height: 8;
+    display: none;
+}
+LargeSelectWidget:focus-within > OptionList {
+    display: block;
+}
+"""
+
+    class Changed(Message):
+        """Posted when the selected value changes."""
+        def __init__(self, widget: "LargeSelectWidget", value):
+            super().__init__()
+            self.widget = widget
+            self.value = value
+
+        @property
+        def control(self) -> "LargeSelectWidget":
+            return self.widget
+
+    value = var(None, init=False)
+
+    def __init__(self, field: "Field", index, limit: int = 50, required: bool = False,
+                 prompt: str = "", value=None, **kwargs):  # Forward reference
+        super().__init__(**kwargs)
+        self.field = field
+        self.index = index
+        self.limit = limit
+        self.required = required
+        self._input = Input(placeholder=prompt, select_on_focus=False)
+        self._options = OptionList()
+        self._found: List = []
+        self.set_reactive(LargeSelectWidget.value, value)
+
+    def compose(self):
+        self._input.value = self.index.label(self.value) or ""
+        yield self._input
+        yield self._options
+
+    def watch_value(self, value):
+        with self.prevent(Input.Changed):
+            self._input.value = self.index.label(value) or ""
+        self.post_message(self.Changed(self, value))
+
+    def show_matches(self, query: str):
+        self._found = self.index.search(query, self.limit)
+        self._options.clear_options()
+        self._options.add_options([Option(label, id=str(i)) for i, (label, value) in enumerate(self._found)])
+        if self._found:
+            self._options.highlighted = 0
+
+    @on(Input.Changed)
+    def input_changed(self, event: Input.Changed):
+        event.stop()
+        if not event.value:
+            self.value = None
+        self.show_matches(event.value)
+
+    @on(Input.Submitted)
+    def input_submitted(self, event: Input.Submitted):
+        event.stop()
+        if self._found:
+            self.value = self._found[self._options.highlighted or 0][1]
+
+    @on(OptionList.OptionSelected)
+    def option_selected(self, event: OptionList.OptionSelected):
+        event.stop()
+        self.value = self._found[int(event.option.id)][1]
+        self._input.focus()
+
+    def on_key(self, event):
+        if event.key == "down" and self._input.has_focus and self._found:
+            event.stop()
+            self._options.focus()
+
+    def validate(self, value):
+        if value is None:
+            if self.required:
+                return Succeed().failure("A value is required")
+        elif value not in self.index:
+            return Succeed().failure("Not a valid choice")
+        return Succeed().success()
+
+
+# The messages posted when the user changes a form widget's value.
+CHANGE_EVENTS = (Input.Changed, TextArea.Changed, Checkbox.Changed, Select.Changed, LargeSelectWidget.Changed)
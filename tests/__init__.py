@@ -3,6 +3,11 @@ import pytest
 from textual.app import App
 from textual_forms.form import Form
 from textual_forms.field import Field
+from textual_forms.widget import ErrorDisplay
+
+def shown_errors(app):
+    """The error messages on display in app."""
+    return [msg for display in app.query(ErrorDisplay) for msg in display.messages]
 
 def one_field_app(p_field):
 
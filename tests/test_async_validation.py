@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+from textual.validation import Function
+from textual_forms.form import Form
+from textual_forms.field import StringField
+from textual_forms.validators import AsyncValidator, ThreadedValidator
+
+from . import one_field_app
+
+import pytest
+
+
+class SlowUnique(AsyncValidator):
+    """Pretend to look the value up in a database."""
+    taken = {"anna", "otto"}
+
+    async def validate_async(self, value):
+        await asyncio.sleep(0.2)
+        return self.failure("Already taken") if value in self.taken else self.success()
+
+
+class SlowForm(Form):
+    first = StringField(validators=[SlowUnique()])
+    second = StringField(validators=[SlowUnique()])
+    third = StringField(validators=[ThreadedValidator(Function(lambda v: v.islower(), "Not lower case"))])
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_fields_validated_concurrently():
+    form = SlowForm()
+    form.set_data(dict(first="anna", second="bob", third="Carol"))
+    start = time.perf_counter()
+    assert not await form.validate_async()
+    assert time.perf_counter() - start < 0.35
+    assert form.fields["first"].errors == ["Already taken"]
+    assert form.fields["second"].errors == []
+    assert form.fields["third"].errors == ["Not lower case"]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_stale_live_validation_cancelled():
+    field = StringField(id="sf", validators=[SlowUnique()])
+    app = one_field_app(field)()
+    async with app.run_test() as pilot:
+        test_field = app.query_one("#sf")
+        test_field.value = "anna"
+        await pilot.pause(0.05)
+        test_field.value = "anne"
+        await pilot.pause(0.3)
+        assert app.form.fields["field"].errors == []
+        assert not app.query(".erm")
+        test_field.value = "otto"
+        await pilot.pause(0.3)
+        assert app.form.fields["field"].errors == ["Already taken"]
+
+
+def test_threaded_validator_checked_headlessly():
+    assert SlowForm.check_data(dict(first="anna", second="x", third="Loud")) == {"third": ["Not lower case"]}
@@ -0,0 +1,40 @@
+import io
+import json
+
+from textual_forms.bulk import RECORD, bulk_validate, write_report
+from textual_forms.field import IntegerField, StringField
+from textual_forms.form import Form
+from textual_forms.validators import Palindromic
+
+
+class ImportForm(Form):
+    name = StringField(validators=[Palindromic()])
+    age = IntegerField(required=False)
+
+
+def records(n):
+    for i in range(n):
+        yield dict(name="anna" if i % 7 else "bob by", age=i if i % 5 else "x")
+
+
+EXPECTED = [(i, errors) for i, record in enumerate(records(500)) if (errors := ImportForm.check_data(record))]
+
+
+def test_pool_preserves_order():
+    results = list(bulk_validate(ImportForm, records(500), workers=2, chunk_size=16))
+    assert results == EXPECTED
+    assert results == list(bulk_validate(ImportForm, records(500), workers=0, chunk_size=16))
+
+
+def test_files(tmp_path):
+    jsonl = tmp_path / "import.jsonl"
+    jsonl.write_text('{"name": "otto", "age": 3}\n\n{"name": "ot\n[1]\n{"name": "no"}\n')
+    (bad, bad_errors), *rest = bulk_validate(ImportForm, jsonl, workers=2, chunk_size=2)
+    assert bad == 2 and bad_errors[RECORD][0].startswith("Invalid JSON")
+    assert rest == [(3, {RECORD: ["Not a record"]}), (4, {"name": ["Not palindromic"]})]
+
+    csv_file = tmp_path / "import.csv"
+    csv_file.write_text("name,age\nanna,1\nbob,x\n")
+    out = io.StringIO()
+    assert write_report(bulk_validate(ImportForm, csv_file, workers=0), out) == 1
+    assert json.loads(out.getvalue()) == {"record": 1, "errors": {"age": ["Must be a valid integer."]}}
@@ -0,0 +1,42 @@
+from textual_forms.demo import build_app
+from textual_forms.demo import testform
+
+import pytest
+
+
+def test_unrendered_changes():
+    form = testform.TestForm(data=dict(name="anna", age=42))
+    assert not form.is_dirty and form.get_changes() == {}
+    form.set_data(dict(age=40, choice="Red"))
+    assert form.modified == {"age", "choice"}
+    assert form.get_changes() == {"age": 40, "choice": "Red"}
+    form.set_data(dict(age=42))
+    assert form.get_changes() == {"choice": "Red"}
+    form.mark_clean(["choice"])
+    assert not form.is_dirty
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_widget_changes():
+    app = build_app(data=dict(name="bob", age=None, description="First"))
+    async with app.run_test(size=(80, 30)) as pilot:
+        await pilot.pause()
+        form = app.app_form
+        assert not form.is_dirty
+        app.query_one("#form-age").value = "12"
+        app.query_one("#form-isactive").value = True
+        await pilot.pause()
+        assert form.get_changes() == {"age": 12, "is_active": True}
+        app.query_one("#form-isactive").value = False
+        await pilot.pause()
+        assert form.modified == {"age"}
+
+        form.mark_clean()
+        assert not form.is_dirty
+        app.query_one("#form-description").value = "Second"
+        await pilot.pause()
+        assert form.get_changes() == {"description": "Second"}
+
+        form.rform.rebind(data=dict(name="otto"))
+        await pilot.pause()
+        assert not form.is_dirty
@@ -0,0 +1,68 @@
+import pickle
+
+from textual_forms.coerce import CoercionError
+from textual_forms.demo import testform
+from textual_forms.field import IntegerField, StringField
+from textual_forms.form import Form
+
+from .test_conditional_fields import CarForm
+
+import pytest
+
+
+class Celsius(IntegerField):
+    def to_python(self, value):
+        return super().to_python(value.rstrip("C"))
+
+
+class ReadingForm(Form):
+    site = StringField()
+    temperature = Celsius(required=False)
+
+
+def test_records():
+    coercer = testform.TestForm.coercer()
+    assert testform.TestForm.coercer() is coercer
+    assert coercer.names == ("name", "age", "description", "is_active", "choice")
+    record = coercer.record(dict(name="anna", age="42", description="Hi", is_active="yes", choice="Red"))
+    assert record == coercer.record_type("anna", 42, "Hi", True, "Red")
+    assert record.age == 42
+    assert coercer.to_python(dict(name="anna", age=None, description="Hi", choice="Red"))["age"] is None
+    assert coercer.to_widget_values(record) == dict(name="anna", age="42", description="Hi", is_active=True, choice="Red")
+
+
+def test_errors():
+    coercer = testform.TestForm.coercer()
+    with pytest.raises(CoercionError) as info:
+        coercer.record(dict(name="", age="4x", description="Hi", choice="Green"))
+    assert info.value.errors == {
+        "name": ["A value is required"],
+        "age": ["Must be a valid integer."],
+        "choice": ["Not a valid choice"],
+    }
+    rows = [dict(site="a", temperature="3C"), dict(site="b", temperature="hot")]
+    records = ReadingForm.coercer().records(rows)
+    assert next(records).temperature == 3  # The subclass's to_python is used
+    with pytest.raises(CoercionError, match="Record 1: temperature: Must be a valid integer."):
+        next(records)
+
+
+def test_form_records():
+    form = testform.TestForm(data=dict(name="anna", age=4, description="d", choice="Red"))
+    record = form.get_record()
+    assert record.age == 4 and record.is_active is False
+    other = testform.TestForm()
+    other.set_record(record._replace(age=6), validate=False)
+    assert other.get_data()["age"] == 6
+    assert other.get_record() == record._replace(age=6)
+
+
+def test_hidden_fields_and_pickling():
+    record = CarForm(data=dict(age=12)).get_record()
+    assert record == CarForm.coercer().record_type(12, None, None, None)
+    assert CarForm.coercer().record(dict(age=12, make="")) == record
+    assert pickle.loads(pickle.dumps(record)) == record
+    with pytest.raises(ValueError, match="underscore"):
+        class Private(Form):
+            _secret = StringField()
+        Private.coercer()
@@ -0,0 +1,48 @@
+from textual_forms.demo import build_app
+from textual_forms.demo import testform
+from textual_forms.field import StringField
+from textual_forms.form import CompactRenderedForm, Form
+from textual_forms.widget import ErrorDisplay
+
+import pytest
+
+from . import shown_errors
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_flat_grid():
+    form = testform.TestForm(title="Compact", render_type=CompactRenderedForm)
+    app = build_app(form=form)
+    async with app.run_test(size=(80, 30)) as pilot:
+        rform = app.query_one("#form-container")
+        for field in form.fields.values():
+            assert field.widget.parent is rform
+        assert len(rform.children) == 1 + 3 * len(form.fields) + 1
+        assert len(app.query(ErrorDisplay)) == len(form.fields)
+        assert rform.styles.keyline[0] == "none"  # RenderedForm's CSS isn't inherited
+
+        app.query_one("#form-name").value = "ab"
+        await pilot.pause()
+        assert shown_errors(app) == ["Not palindromic"]
+        name_errors = rform.children[3]
+        assert name_errors.messages == ["Not palindromic"]
+        assert name_errors.region.y == form.fields["name"].widget.region.y
+
+        app.query_one("#form-name").value = "aba"
+        await pilot.click("#submit")
+        await pilot.pause()
+        assert app.submit_count == 1
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_scrolls_below_the_fold():
+    attrs = {f"f{i:02}": StringField(required=False, id=f"f{i:02}") for i in range(40)}
+    form = type("TallForm", (Form,), attrs)(render_type=CompactRenderedForm)
+    app = build_app(form=form)
+    async with app.run_test(size=(80, 24)) as pilot:
+        await pilot.pause()
+        rform = app.query_one("#form-container")
+        assert rform.max_scroll_y > 0
+        rform.scroll_end(animate=False)
+        await pilot.pause()
+        assert rform.scroll_y == rform.max_scroll_y
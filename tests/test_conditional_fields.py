@@ -0,0 +1,64 @@
+from textual_forms.demo import build_app
+from textual_forms.field import BooleanField, Condition, IntegerField, StringField
+from textual_forms.form import Form
+
+import pytest
+
+
+class CarForm(Form):
+    age = IntegerField(id="age")
+    has_car = BooleanField(label="Car?", id="has-car", show_if=Condition(["age"], lambda age: age >= 17))
+    make = StringField(id="make", show_if="has_car")
+    model = StringField(id="model", show_if="has_car", required=False)
+
+
+def test_schema():
+    schema = CarForm._schema
+    assert schema.controls == {"age": ("has_car",), "has_car": ("make", "model")}
+    assert schema.conditional == ("has_car", "make", "model")
+    with pytest.raises(ValueError):
+        class Circular(Form):
+            a = StringField(show_if="b")
+            b = StringField(show_if="a")
+
+
+def test_hidden_fields_skipped():
+    form = CarForm()
+    assert [name for name, field in form.fields.items() if field.hidden] == ["has_car", "make", "model"]
+    form.set_data(dict(age=12, has_car=True))
+    assert form.fields["make"].hidden
+    assert form.validate()
+    assert form.get_data(include_hidden=False) == {"age": 12}
+
+    form.set_data(dict(age=30))
+    assert not form.fields["make"].hidden
+    assert list(form.get_data(include_hidden=False)) == ["age", "has_car", "make", "model"]
+
+    assert CarForm.check_data(dict(age=12, has_car=True)) == {}
+    assert CarForm.check_data(dict(age=30, has_car=True)) == {"make": ["A value is required"]}
+    assert CarForm.check_data(dict(age=30, has_car=False)) == {}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_toggle_without_remount():
+    app = build_app(form=CarForm())
+    async with app.run_test(size=(80, 30)) as pilot:
+        form = app.app_form
+        make = app.query_one("#make")
+        assert not make.parent.display
+        app.query_one("#age").value = "40"
+        await pilot.pause()
+        assert app.query_one("#has-car").parent.display
+        assert not make.parent.display
+        app.query_one("#has-car").value = True
+        await pilot.pause()
+        assert make.parent.display
+        make.value = "Ford"
+        app.query_one("#age").value = "4"
+        await pilot.pause()
+        assert not make.parent.display
+        assert app.query_one("#make") is make
+        app.query_one("#age").value = "41"
+        await pilot.pause()
+        assert make.parent.display and make.value == "Ford"
+        assert form.get_data(include_hidden=False)["make"] == "Ford"
@@ -1,6 +1,10 @@
 from textual_forms.demo import build_app
+from textual.widgets import Input
+from textual_forms.widget import changes_suppressed
 import pytest
 
+from . import shown_errors
+
 @pytest.mark.asyncio(loop_scope="function")
 async def test_data_injection():
     my_data = dict(name="anna", age=100, is_active=True, choice='Blue', description="Nobody!")
@@ -21,3 +25,41 @@ async def test_field_order():
         assert form.get_data() == my_data
         assert list(app.app_form.fields) == fo + ["name", "description", "choice"]
 
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_bulk_set_data_suppresses_changes():
+    app = build_app()
+    async with app.run_test(size=(80, 30)) as p:
+        rform = app.query_one("#form-container")
+        widget = app.app_form.fields["name"].widget
+        posted = []
+        post_message = widget.post_message
+
+        def record_post(message):
+            if post_message(message):
+                posted.append(message)
+            return True
+
+        widget.post_message = record_post
+        rform.set_data(dict(name="bobby", age=1331, description="Loaded"))
+        await p.pause()
+        assert not [m for m in posted if isinstance(m, Input.Changed)]
+        assert rform.get_data()["name"] == "bobby"
+        assert app.app_form.fields["name"].errors == ["Not palindromic"]
+        assert len(app.app_form.fields["age"].errors) == 2
+        assert len(shown_errors(app)) == 3
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_suppression_leaves_other_inputs_alone():
+    app = build_app()
+    async with app.run_test(size=(80, 30)):
+        rform = app.query_one("#form-container")
+        widget = app.app_form.fields["name"].widget
+        validate_on = widget.validate_on
+        bystander = Input()
+        assert "changed" in bystander.validate_on
+        with changes_suppressed(rform, [widget]):
+            assert "changed" not in widget.validate_on
+            assert "changed" in bystander.validate_on
+        assert widget.validate_on is validate_on and "changed" in validate_on
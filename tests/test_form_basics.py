@@ -1,6 +1,7 @@
 from textual_forms.demo import build_app
 from textual_forms.form import Form
-from textual_forms.field import ChoiceField
+from textual_forms.field import ChoiceField, StringField
+from textual.validation import Function
 
 import pytest
 import pytest_asyncio
@@ -84,3 +85,65 @@ async def test_buttons():
         assert app.cancel_count == 1
         await pilot.click(sbm_btn)
         assert app.submit_count == 1
+
+def test_instances_bind_own_fields():
+    first, second = SelectForm(), SelectForm()
+    prototype = SelectForm._base_fields["choice"]
+    assert first.fields["choice"] is not second.fields["choice"]
+    assert first.fields["choice"].form is first
+    assert first.fields["choice"].choices is prototype.choices
+    assert prototype.form is None
+    first.fields["choice"].errors.append("Oops")
+    assert second.fields["choice"].errors == []
+
+
+def test_unchanged_fields_not_revalidated():
+    calls = []
+
+    def counted(value):
+        calls.append(value)
+        return value.islower()
+
+    class CountedForm(Form):
+        first = StringField(validators=[Function(counted, "Not lower case")])
+        second = StringField(validators=[Function(counted, "Not lower case")])
+
+    form = CountedForm()
+    form.set_data(dict(first="one", second="Two"))
+    assert not form.validate()
+    assert calls == ["one", "Two"]
+    assert not form.validate()
+    assert calls == ["one", "Two"]
+    form.set_data(dict(second="two"))
+    assert form.validate()
+    assert calls == ["one", "Two", "two"]
+
+
+class ParentForm(Form):
+    name = StringField()
+    age = StringField()
+
+
+class ChildForm(ParentForm):
+    email = StringField()
+    age = None
+
+
+class GrandchildForm(ChildForm):
+    name = StringField(placeholder="Full name")
+    phone = StringField()
+
+
+def test_inherited_fields():
+    assert list(ChildForm().fields) == ["name", "email"]
+    form = GrandchildForm()
+    assert list(form.fields) == ["name", "email", "phone"]
+    assert form.fields["name"].kwargs == {"placeholder": "Full name"}
+    assert list(ParentForm().fields) == ["name", "age"]
+
+
+def test_field_orderings_compiled_once():
+    schema = GrandchildForm._schema
+    first = GrandchildForm(field_order=["phone", "nonesuch"])
+    assert list(first.fields) == ["phone", "name", "email"]
+    assert schema.ordering(["phone", "nonesuch"]) is schema.ordering(("phone", "nonesuch"))
@@ -0,0 +1,116 @@
+from textual_forms.demo import build_app
+from textual_forms.field import IntegerField, StringField
+from textual_forms.form import Form
+from textual_forms.validators import FormFunction, FormValidator
+
+import pytest
+
+from . import shown_errors
+
+
+class BookingForm(Form):
+    start = IntegerField(id="start")
+    end = IntegerField(id="end")
+    note = StringField(required=False)
+    ordered = FormFunction(["start", "end"], lambda start, end: end > start, "Must end after it starts")
+
+
+class InvoiceForm(Form):
+    first = IntegerField()
+    second = IntegerField()
+    total = IntegerField()
+    balanced = FormFunction(
+        ["first", "second", "total"],
+        lambda first, second, total: first + second == total,
+        "Doesn't add up",
+        report_to=["first", "total"],
+    )
+
+
+def test_dependency_graph():
+    schema = BookingForm._schema
+    assert list(schema.rules) == ["ordered"]
+    assert schema.dependents["start"] == schema.dependents["end"] == (schema.rules["ordered"],)
+    assert "note" not in schema.dependents
+    assert schema.reports == {"end": (schema.rules["ordered"],)}
+    assert not hasattr(BookingForm, "ordered")
+
+    class Unordered(BookingForm):
+        ordered = None
+
+    assert not Unordered._schema.rules
+
+    with pytest.raises(ValueError):
+        class Broken(Form):
+            start = IntegerField()
+            ordered = FormFunction(["start", "finish"], lambda start, finish: True)
+
+
+def test_form_validation():
+    form = BookingForm()
+    form.set_data(dict(start=5, end=3))
+    assert not form.validate()
+    assert form.fields["end"].errors == ["Must end after it starts"]
+    assert form.fields["start"].errors == []
+    form.set_data(dict(end=8))
+    assert form.validate()
+    assert form.fields["end"].errors == []
+
+    form = InvoiceForm()
+    form.set_data(dict(first=1, second=2, total=4))
+    assert not form.validate()
+    assert form.fields["first"].errors == form.fields["total"].errors == ["Doesn't add up"]
+    assert form.fields["second"].errors == []
+
+
+def test_only_dependent_rules_checked():
+    calls = []
+
+    class CountedForm(Form):
+        a = IntegerField()
+        b = IntegerField()
+        c = IntegerField()
+        ab = FormFunction(["a", "b"], lambda a, b: calls.append("ab") or True)
+        bc = FormFunction(["b", "c"], lambda b, c: calls.append("bc") or True)
+
+    form = CountedForm()
+    form.set_data(dict(a=1, b=2, c=3), validate=False)
+    form.check_rules(["a"])
+    assert calls == ["ab"]
+    form.check_rules(["b"])
+    assert calls == ["ab", "ab", "bc"]
+
+
+def test_rules_see_coerced_values():
+    seen = []
+
+    class Recorder(FormValidator):
+        def validate(self, values):
+            seen.append(values)
+            return self.success()
+
+    class NoteForm(Form):
+        count = IntegerField(required=False)
+        note = StringField(required=False)
+        recorded = Recorder(["count", "note"])
+
+    data = dict(count="7", note="")
+    NoteForm(data=data).validate()
+    NoteForm.check_data(data)
+    assert seen == [dict(count=7, note=None)] * 2
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_live_cross_field_validation():
+    app = build_app(form=BookingForm())
+    async with app.run_test(size=(80, 30)) as pilot:
+        form = app.app_form
+        app.query_one("#start").value = "10"
+        app.query_one("#end").value = "2"
+        await pilot.pause()
+        assert form.fields["end"].errors == ["Must end after it starts"]
+        assert shown_errors(app) == ["Must end after it starts"]
+        app.query_one("#start").value = "1"
+        await pilot.pause()
+        assert form.fields["end"].errors == []
+        assert not shown_errors(app)
@@ -0,0 +1,82 @@
+from textual.app import App
+
+from textual_forms.field import BooleanField, ChoiceField, IntegerField, StringField
+from textual_forms.form import Form
+from textual_forms.formset import FormSet
+from textual_forms.validators import FormFunction
+
+import pytest
+
+
+class LineForm(Form):
+    part = StringField(id="part")
+    quantity = IntegerField(id="quantity")
+    unit = ChoiceField([("Each", "ea"), ("Box", "box")], id="unit", required=False)
+    urgent = BooleanField(label="Urgent", id="urgent")
+    boxed = FormFunction(["quantity", "unit"], lambda quantity, unit: unit != "box" or quantity <= 10, "At most 10 boxes")
+
+
+LINES = [dict(part=f"P{n:04}", quantity=n % 7 + 1, unit="ea", urgent=not n % 3) for n in range(2000)]
+
+
+class FormSetApp(App):
+    def __init__(self, formset):
+        super().__init__()
+        self.formset = formset
+
+    def compose(self):
+        yield self.formset.render(id="lines")
+
+
+def test_headless_rows():
+    formset = FormSet(LineForm, LINES[:3])
+    assert formset.validate()
+    formset.set_data([dict(part="", quantity="x"), dict(part="P1", quantity=12, unit="box", urgent=False)])
+    assert not formset.validate()
+    assert formset.errors == {
+        0: {"part": ["A value is required"], "quantity": ["Must be a valid integer."]},
+        1: {"unit": ["At most 10 boxes"]},
+    }
+    assert formset.get_data()[1]["unit"] == "box"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_one_row_of_widgets():
+    formset = FormSet(LineForm, LINES)
+    app = FormSetApp(formset)
+    async with app.run_test(size=(100, 30)) as pilot:
+        await pilot.pause()
+        rendered = app.query_one("#lines")
+        assert len(app.query("#part")) == 1
+        assert rendered.table.row_count == 2000
+        assert rendered.row_index == 0 and app.query_one("#part").value == "P0000"
+
+        rendered.table.focus()
+        await pilot.press("down", "down")
+        await pilot.pause()
+        assert rendered.row_index == 2
+        assert app.query_one("#quantity").value == "3"
+
+        app.query_one("#quantity").value = "12x"
+        await pilot.pause()
+        assert formset.rows[2]["quantity"] == "12x"
+        assert formset.errors == {2: {"quantity": ["Must be a valid integer."]}}
+        assert "Must be a valid integer." in str(rendered.error_display.render())
+
+        app.query_one("#quantity").value = "12"
+        app.query_one("#unit").value = "box"
+        await pilot.pause()
+        assert formset.errors == {2: {"unit": ["At most 10 boxes"]}}
+        assert rendered.table.get_cell_at((2, 2)).plain == "Box"
+        assert rendered.table.get_cell_at((2, 0)) == "P0002"
+
+        await pilot.press("up")
+        await pilot.pause()
+        assert rendered.row_index == 1
+        assert not str(rendered.error_display.render())
+        assert formset.get_data()[2] == dict(part="P0002", quantity=12, unit="box", urgent=False)
+
+        formset.set_data(LINES[:5])
+        await pilot.pause()
+        assert rendered.table.row_count == 5 and rendered.row_index == 1
+        assert formset.validate()
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+from textual_forms.demo import testform
+from textual_forms.field import IntegerField, LargeChoiceField
+from textual_forms.form import Form
+from textual_forms.validators import FormFunction
+
+
+def test_valid_data():
+    data = dict(name="anna", age=42, description="Hi", is_active=True, choice="Red")
+    assert testform.TestForm.check_data(data) == {}
+    assert testform.TestForm.check_data(dict(data, age="", is_active=None)) == {}
+
+
+def test_per_field_errors():
+    errors = testform.TestForm.check_data(dict(name="bobby", age="12x", choice="Green"))
+    assert errors == {
+        "name": ["Not palindromic"],
+        "age": ["Must be a valid integer."],
+        "description": ["A value is required"],
+        "choice": ["Not a valid choice"],
+    }
+    assert testform.TestForm.check_data(dict(name="abba", age=7, description="x", choice="Blue")) == {
+        "age": ["Not an even number"],
+    }
+    assert testform.TestForm.check_data(dict(description="x", choice="Blue"))["name"] == ["A value is required"]
+
+
+def test_records_and_rules():
+
+    class RangeForm(Form):
+        low = IntegerField()
+        high = IntegerField()
+        size = LargeChoiceField([("Small", "S"), ("Large", "L")])
+        ordered = FormFunction(["low", "high"], lambda low, high: low < high, "Must exceed low")
+
+    records = iter([
+        dict(low=1, high=2, size="S"),
+        dict(low="3", high="2", size="L"),
+        dict(low="x", high=2, size="M"),
+    ])
+    assert list(RangeForm.check_records(records)) == [
+        {},
+        {"high": ["Must exceed low"]},
+        {"low": ["Must be a valid integer."], "size": ["Not a valid choice"]},
+    ]
+
+
+def test_no_widget_imports():
+    # Declaring and checking forms mustn't import any widgets (or the app)
+    script = """\
+import sys
+from textual_forms import Form, StringField, ChoiceField
+class F(Form):
+    name = StringField()
+    colour = ChoiceField(choices=[("Red", "r")], required=False)
+assert F.check_data(dict(name="", colour=None)) == {"name": ["A value is required"]}
+form = F()
+assert form.get_data() == dict(name="", colour=None)
+form.set_data(dict(name="anna", colour="r"))
+form.set_data(dict(colour=None))
+assert form.get_data() == dict(name="anna", colour=None) and form.modified == {"name"}
+print("\\n".join(sorted(sys.modules)))
+"""
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    loaded = output.split()
+    assert "textual_forms.widget" not in loaded and "textual_forms.rendered" not in loaded
+    assert not [name for name in loaded if name.startswith(("textual.widgets", "textual.app", "textual.containers"))]
@@ -0,0 +1,44 @@
+from textual_forms.demo import build_app
+from textual_forms.instrument import SpanStats, instrumentation
+
+import pytest
+
+
+@pytest.fixture
+def stats():
+    hook = instrumentation.add_hook(SpanStats())
+    yield hook
+    instrumentation.remove_hook(hook)
+
+
+def test_no_hooks_no_timing():
+    assert not instrumentation.hooks
+    with instrumentation.span("validate") as span:
+        assert span is None
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_spans_and_counters(stats):
+    app = build_app()
+    async with app.run_test(size=(80, 30)) as pilot:
+        phases = {key[0] for key in stats.stats}
+        assert {"create_widget", "compose", "mount"} <= phases
+        assert stats.stats[("create_widget", "name", None)][0] == 1
+
+        mounted = instrumentation.counters["mounted"]
+        removed = instrumentation.counters["removed"]
+        app.query_one("#form-name").value = "anne"
+        await pilot.pause()
+        assert stats.stats[("validator", "name", "Palindromic")][0] >= 1
+        assert stats.stats[("show_errors", "name", None)][0] == 1
+        assert instrumentation.counters["mounted"] == mounted + 1
+
+        app.query_one("#form-name").value = "anna"
+        await pilot.pause()
+        app.query_one("#form-name").value = "ann"
+        await pilot.pause()
+        # The field's one error display is updated in place
+        assert instrumentation.counters["mounted"] == mounted + 1
+        assert instrumentation.counters["removed"] == removed
+        (phase, field, validator), (count, total, most) = stats.slowest(1)[0]
+        assert count and most <= total
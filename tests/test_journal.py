@@ -0,0 +1,67 @@
+from textual_forms.demo import build_app
+from textual_forms.journal import DraftJournal
+
+import pytest
+
+
+def test_replay_merges_batches(tmp_path):
+    journal = DraftJournal(tmp_path / "draft.jsonl")
+    journal.write({"name": "ann", "age": "3"})
+    journal.write({"name": "anna"})
+    with journal.path.open("a") as f:
+        f.write('{"name": "an')  # Crashed mid-write
+    restarted = DraftJournal(journal.path)
+    assert restarted.replay() == {"name": "anna", "age": "3"}
+    restarted.write({"age": "42"})
+    assert DraftJournal(journal.path).replay() == {"name": "anna", "age": "42"}
+
+    with journal.path.open("a") as f:
+        f.write('{"age": "43"}')  # Crashed before the newline
+    restarted = DraftJournal(journal.path)
+    restarted.write({"name": "otto"})
+    assert DraftJournal(journal.path).replay() == {"name": "otto", "age": "43"}
+
+
+def test_write_after_clear_dropped(tmp_path):
+    journal = DraftJournal(tmp_path / "draft.jsonl")
+    generation = journal.generation
+    journal.write({"name": "ann"}, generation)
+    journal.clear()
+    journal.write({"name": "anna"}, generation)  # From a flush started before the clear
+    assert not journal.path.exists()
+
+
+def test_compaction(tmp_path):
+    journal = DraftJournal(tmp_path / "draft.jsonl", compact_after=10)
+    for i in range(25):
+        journal.write({"name": f"v{i}", f"f{i % 3}": i})
+    assert len(journal.path.read_text().splitlines()) <= 10
+    assert journal.replay() == {"name": "v24", "f0": 24, "f1": 22, "f2": 23}
+    journal.clear()
+    assert not journal.path.exists()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_autosave_and_restore(tmp_path):
+    path = tmp_path / "draft.jsonl"
+    app = build_app()
+    async with app.run_test(size=(80, 30)) as pilot:
+        rform = app.query_one("#form-container")
+        journal = rform.autosave(path, interval=0.5)
+        for name in "o", "ot", "ott", "otto":
+            app.query_one("#form-name").value = name
+        app.query_one("#form-isactive").value = True
+        await pilot.pause()
+        assert not path.exists()
+        await pilot.pause(0.7)
+        assert journal.replay() == {"name": "otto", "is_active": True}
+
+    app = build_app()
+    async with app.run_test(size=(80, 30)) as pilot:
+        rform = app.query_one("#form-container")
+        rform.autosave(path)
+        assert rform.get_data()["name"] == "otto"
+        assert rform.get_data()["is_active"] is True
+        await pilot.click("#cancel")
+        await pilot.pause()
+        assert not path.exists()
@@ -0,0 +1,53 @@
+from textual_forms.choices import ChoiceIndex
+from textual_forms.field import LargeChoiceField
+
+from . import one_field_app
+
+import pytest
+
+PARTS = [(f"Part {n:05} {'bolt' if n % 2 else 'nut'}", f"P{n:05}") for n in range(50_000)]
+
+
+def test_prefix_matches_first():
+    index = ChoiceIndex([("Blueberry", 1), ("Red", 2), ("Blue", 3), ("Navy blue", 4)])
+    assert index.search("blu") == [("Blue", 3), ("Blueberry", 1), ("Navy blue", 4)]
+    assert index.search("blu", limit=2) == [("Blue", 3), ("Blueberry", 1)]
+    assert index.search("") == [("Blueberry", 1), ("Red", 2), ("Blue", 3), ("Navy blue", 4)]
+
+
+def test_choices_from_callable_read_once():
+    calls = []
+
+    def load():
+        calls.append(1)
+        return iter(PARTS)
+
+    index = ChoiceIndex(load)
+    assert calls == []
+    assert len(index) == 50_000
+    assert index.search("00042 nut") == [("Part 00042 nut", "P00042")]
+    assert "P49999" in index
+    assert index.label("P00007") == "Part 00007 bolt"
+    assert calls == [1]
+
+
+def test_narrowing_search():
+    index = ChoiceIndex(PARTS)
+    assert len(index.matches("nut")) == 25_000
+    assert index.matches("9 nut") == [i for i, (label, value) in enumerate(PARTS) if "9 nut" in label.casefold()]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_type_ahead_selection():
+    field = LargeChoiceField(PARTS, id="part", prompt="Part number")
+    app = one_field_app(field)()
+    async with app.run_test() as pilot:
+        widget = app.query_one("#part")
+        widget.query_one("Input").focus()
+        await pilot.press(*"1235", "space", "b")
+        await pilot.press("enter")
+        await pilot.pause()
+        assert widget.value == "P01235"
+        assert app.form.get_data() == {"field": "P01235"}
+        assert app.form.validate()
+        assert len(widget._found) <= widget.limit
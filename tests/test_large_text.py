@@ -0,0 +1,67 @@
+from textual_forms.field import LargeTextField
+from textual_forms.validators import LineFunction
+
+from . import one_field_app
+
+import pytest
+
+LOG = "\n".join(f"{n:06} INFO all well" for n in range(20_000))
+
+
+def no_tabs():
+    return LineFunction(lambda line: "\t" not in line, "No tabs allowed")
+
+
+def test_headless_limits():
+    field = LargeTextField(max_length=10, max_lines=2, validators=[no_tabs()])
+    assert field.check("short") == []
+    assert field.check("a\nb\nc") == ["At most 2 lines allowed"]
+    assert field.check("far\ttoo long") == ["At most 10 characters allowed", "No tabs allowed"]
+    assert field.check("") == ["A value is required"]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_tracks_edits():
+    field = LargeTextField(id="log", max_length=len(LOG) + 5, validators=[no_tabs()])
+    app = one_field_app(field)()
+    async with app.run_test() as pilot:
+        widget = app.query_one("#log")
+        widget.value = LOG
+        await pilot.pause()
+        field = app.form.fields["field"]
+        assert widget.length == len(LOG) and widget.line_count == 20_000
+        assert field.validate() == []
+        assert "".join(field.chunks(1000)) == LOG
+        assert all(len(chunk) == 1000 for chunk in list(field.chunks(1000))[:-1])
+
+        version = widget.version
+        widget.insert("\tx\ny", (100, 3))
+        assert widget.version == version + 1
+        assert widget.length == len(widget.text) == len(LOG) + 4
+        assert widget.line_count == 20_001
+        assert field.needs_validation
+        assert field.validate() == ["No tabs allowed"]
+        checked = []
+        field.validators[0].function = lambda line: checked.append(line) or "\t" not in line
+        assert field.validate() == ["No tabs allowed"]  # Already validated at this version
+        widget.insert("!", (5000, 0))
+        assert field.validate() == ["No tabs allowed"]
+        assert checked == ["!" + LOG.splitlines()[4999]]
+
+        widget.delete((100, 3), (101, 0))
+        assert field.validate() == []
+        assert checked[-1] == LOG.splitlines()[100][:3] + "y" + LOG.splitlines()[100][3:]
+        widget.insert("123456")
+        assert field.validate() == [f"At most {len(LOG) + 5} characters allowed"]
+        widget.undo()
+        assert widget.length == len(widget.text)
+        assert field.validate() == []
+        assert app.form.get_data()["field"] is widget.value
+
+        app.form.mark_clean()
+        widget.insert("x", (0, 0))
+        await pilot.pause()
+        assert app.form.modified == {"field"}
+        widget.delete((0, 0), (0, 1))
+        await pilot.pause()
+        assert not app.form.is_dirty
@@ -0,0 +1,100 @@
+import asyncio
+
+from textual_forms import StringField
+from textual_forms.stream import RecordStream
+
+from . import one_field_app
+
+import pytest
+
+
+async def settle(pilot, condition):
+    """Sync sources and sinks run in threads, which pilot.pause() does not wait for."""
+    for _ in range(100):
+        if condition():
+            return
+        await pilot.pause(0.01)
+    assert condition()
+
+
+async def async_records(n):
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield {"field": f"record {i}"}
+
+
+@pytest.mark.parametrize("records", [
+    lambda: ({"field": f"record {i}"} for i in range(5)),
+    lambda: async_records(5),
+])
+@pytest.mark.asyncio(loop_scope="function")
+async def test_stream_records(records):
+    saved = []
+    app = one_field_app(StringField(id="sf", required=False))()
+    async with app.run_test() as pilot:
+        rform = app.query_one("#form-container")
+        stream = rform.stream(records(), lambda record, data: saved.append((record, data)), prefetch=2)
+        for i in range(5):
+            await settle(pilot, lambda: stream.count == i and stream.current is not None)
+            assert app.query_one("#sf").value == f"record {i}"
+            assert stream.queue.qsize() <= 2
+            app.query_one("#sf").value = f"edited {i}"
+            # Clicks are ignored while a button shows it has just been pressed
+            app.query_one("#submit").press()
+        await settle(pilot, lambda: stream.finished)
+        assert stream.finished and stream.count == 5
+        assert saved == [({"field": f"record {i}"}, {"field": f"edited {i}"}) for i in range(5)]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_async_sink():
+    saved = []
+
+    async def sink(record, data):
+        await asyncio.sleep(0)
+        saved.append(data["field"])
+
+    app = one_field_app(StringField(id="sf", required=False))()
+    async with app.run_test() as pilot:
+        stream = app.query_one("#form-container").stream(iter([{"field": "a"}, {"field": "b"}]), sink)
+        await settle(pilot, lambda: stream.current is not None)
+        app.query_one("#submit").press()
+        app.query_one("#submit").press()
+        await settle(pilot, lambda: stream.finished)
+        assert saved == ["a", "b"]
+        assert isinstance(stream, RecordStream) and stream.finished
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_submit_before_first_record():
+    saved = []
+
+    async def slow_records():
+        for i in range(2):
+            await asyncio.sleep(0.1)
+            yield {"field": f"r{i}"}
+
+    app = one_field_app(StringField(id="sf", required=False))()
+    async with app.run_test() as pilot:
+        stream = app.query_one("#form-container").stream(slow_records(), lambda record, data: saved.append(record))
+        assert not await stream.submit()
+        await settle(pilot, lambda: stream.current is not None)
+        assert stream.current == {"field": "r0"} and saved == []
+        assert await stream.submit()
+        assert saved == [{"field": "r0"}] and stream.current == {"field": "r1"}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_failing_sink_keeps_record():
+    def sink(record, data):
+        raise ConnectionError("database down")
+
+    app = one_field_app(StringField(id="sf", required=False))()
+    async with app.run_test() as pilot:
+        stream = app.query_one("#form-container").stream(iter([{"field": "a"}, {"field": "b"}]), sink)
+        await settle(pilot, lambda: stream.current is not None)
+        app.query_one("#submit").press()
+        await pilot.pause(0.1)
+        assert stream.current == {"field": "a"} and stream.count == 0
+        assert app.query_one("#sf").value == "a"
+        assert app.is_running
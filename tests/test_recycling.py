@@ -0,0 +1,47 @@
+from textual_forms.demo import build_app
+from textual_forms.demo import testform
+
+import pytest
+
+from . import shown_errors
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_rebind_to_new_form():
+    app = build_app(data=dict(name="bob", age=33, description="First"))
+    async with app.run_test(size=(80, 30)) as pilot:
+        await pilot.pause()
+        old_form = app.app_form
+        rform = old_form.rform
+        widgets = {name: field.widget for name, field in old_form.fields.items()}
+        await pilot.click("#submit")
+        await pilot.pause()
+        assert shown_errors(app)
+
+        new_form = testform.TestForm(data=dict(name="anna", description="Second"))
+        assert new_form.render(id="ignored", recycle=rform) is rform
+        await pilot.pause()
+        assert rform.form is new_form
+        assert not shown_errors(app)
+        for name, field in new_form.fields.items():
+            assert field.widget is widgets[name]
+            assert field.widget.field is field
+        assert new_form.get_data()["name"] == "anna"
+        assert new_form.get_data()["age"] is None
+        assert app.focused is widgets["name"]
+        assert rform.get_data()["description"] == "Second"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_rebind_to_data():
+    app = build_app()
+    async with app.run_test(size=(80, 30)) as pilot:
+        rform = app.app_form.rform
+        rform.rebind(data=dict(name="otto", age=12))
+        await pilot.pause()
+        assert rform.get_data()["name"] == "otto"
+        assert rform.get_data()["age"] == 12
+        rform.rebind(data=dict(age=1331), validate=True)
+        await pilot.pause()
+        assert rform.get_data()["name"] == ""
+        assert len(app.app_form.fields["age"].errors) == 2
@@ -1,5 +1,6 @@
 from textual_forms.demo import build_app
 from textual_forms import StringField
+from textual_forms.validators import Palindromic
 
 from . import one_field_app
 
@@ -40,3 +41,33 @@ async def test_not_empty_ok():
         assert not app.form.validate()
 
 
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_unchanged_errors_not_remounted():
+    field = StringField(id="sf", required=True, validators=[Palindromic()])
+    app = one_field_app(field)()
+    async with app.run_test() as pilot:
+        test_field = app.query_one("#sf")
+        test_field.focus()
+        await pilot.press("a", "b")
+        await pilot.pause()
+        message = app.query_one(".erm")
+        await pilot.press("c")
+        await pilot.pause()
+        assert list(app.query(".erm")) == [message]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_delayed_validation():
+    field = StringField(id="sf", required=True, validators=[Palindromic()], validation_delay=0.2)
+    app = one_field_app(field)()
+    async with app.run_test() as pilot:
+        test_field = app.query_one("#sf")
+        test_field.focus()
+        await pilot.press("a", "b")
+        await pilot.pause()
+        assert not app.query(".erm")
+        await pilot.pause(0.3)
+        assert len(app.query(".erm")) == 1
+        assert app.form.fields["field"].errors == ["Not palindromic"]
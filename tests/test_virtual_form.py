@@ -0,0 +1,74 @@
+from textual.app import App
+from textual_forms.form import Form, VirtualRenderedForm
+from textual_forms.field import StringField
+
+import pytest
+
+
+def big_form_class(n, required=False):
+    attrs = {f"f{i:04}": StringField(required=required, id=f"f{i:04}") for i in range(n)}
+    return type("BigForm", (Form,), attrs)
+
+
+def virtual_app(form):
+
+    class VirtualApp(App):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.form = form
+
+        def compose(self):
+            yield self.form.render(id="form-container")
+
+    return VirtualApp()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_only_visible_fields_mounted():
+    form = big_form_class(500)(render_type=VirtualRenderedForm)
+    app = virtual_app(form)
+    async with app.run_test(size=(80, 30)) as pilot:
+        await pilot.pause()
+        mounted = [f for f in form.fields.values() if f.widget is not None]
+        assert 0 < len(mounted) < 30
+        assert form.fields["f0000"].widget is not None
+        assert form.fields["f0499"].widget is None
+
+        form.fields["f0499"].create_widget = None  # Validated without a widget
+        form.fields["f0499"].raw_value = "x"
+        assert await form.rform.validate()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_values_survive_scrolling():
+    form = big_form_class(300)(render_type=VirtualRenderedForm, data={"f0299": "last"})
+    app = virtual_app(form)
+    async with app.run_test(size=(80, 30)) as pilot:
+        await pilot.pause()
+        form.fields["f0000"].widget.value = "first"
+        rform = app.query_one("#form-container")
+        rform.scroll_end(animate=False)
+        await pilot.pause()
+        await pilot.pause()
+        assert form.fields["f0000"].widget is None
+        assert form.fields["f0299"].widget is not None
+        assert form.fields["f0299"].widget.value == "last"
+        rform.scroll_home(animate=False)
+        await pilot.pause()
+        await pilot.pause()
+        assert form.fields["f0000"].widget.value == "first"
+        data = rform.get_data()
+        assert len(data) == 300
+        assert data["f0000"] == "first" and data["f0299"] == "last"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_required_whether_mounted_or_not():
+    form = big_form_class(60, required=True)(render_type=VirtualRenderedForm)
+    app = virtual_app(form)
+    async with app.run_test(size=(80, 30)) as pilot:
+        await pilot.pause()
+        assert form.fields["f0000"].widget is not None and form.fields["f0059"].widget is None
+        assert not await form.rform.validate()
+        assert all(field.errors == ["A value is required"] for field in form.fields.values())
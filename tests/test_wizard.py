@@ -0,0 +1,98 @@
+from textual.app import App
+
+from textual_forms.field import IntegerField, StringField
+from textual_forms.form import Form, WizardRenderedForm
+from textual_forms.validators import EvenInteger
+
+import pytest
+
+
+class SmallPages(WizardRenderedForm):
+    page_size = 2
+
+
+class OnboardingForm(Form):
+    first = StringField(id="first", required=False)
+    second = IntegerField(id="second", required=False, validators=[EvenInteger()])
+    third = StringField(id="third", required=False)
+    fourth = IntegerField(id="fourth", required=False, validators=[EvenInteger()])
+    fifth = StringField(id="fifth", required=False)
+
+
+class PagedForm(OnboardingForm):
+    pages = [["third", "first"], ["fifth"]]
+
+
+async def press(pilot, selector):
+    # Buttons ignore presses while showing the last one (for 0.2s)
+    await pilot.click(selector)
+    await pilot.pause(0.25)
+
+
+class WizardApp(App):
+    def __init__(self, form):
+        super().__init__()
+        self.form = form
+
+    def compose(self):
+        yield self.form.render(id="wizard")
+
+
+def test_pagination():
+    assert OnboardingForm(render_type=SmallPages).render(id="w").pages == [
+        ["first", "second"], ["third", "fourth"], ["fifth"],
+    ]
+    assert PagedForm(render_type=SmallPages).render(id="w").pages == [
+        ["third", "first"], ["fifth"], ["second", "fourth"],
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_pages_built_lazily():
+    form = OnboardingForm(render_type=SmallPages)
+    app = WizardApp(form)
+    async with app.run_test(size=(80, 30)) as pilot:
+        rform = app.query_one("#wizard")
+        assert [name for name, field in form.fields.items() if field.widget] == ["first", "second"]
+        assert not app.query_one("#back").display and not app.query_one("#submit").display
+
+        app.query_one("#second").value = "3"
+        await press(pilot, "#next")
+        assert rform.page_index == 0
+        assert form.fields["second"].errors == ["Not an even number"]
+
+        app.query_one("#second").value = "4"
+        await pilot.pause()
+        await press(pilot, "#next")
+        assert rform.page_index == 1
+        assert form.fields["third"].widget is not None
+        assert form.fields["fifth"].widget is None
+
+        app.query_one("#fourth").value = "5"
+        await press(pilot, "#back")
+        assert rform.page_index == 0
+        assert form.get_data()["second"] == 4
+        assert form.get_data()["fourth"] == 5
+
+        rform.show_page(2)
+        await pilot.pause()
+        await press(pilot, "#submit")
+        assert rform.page_index == 1
+        assert form.fields["fourth"].errors == ["Not an even number"]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_unmounted_pages_keep_values():
+    class Unkept(SmallPages):
+        keep_pages = False
+
+    form = OnboardingForm(render_type=Unkept)
+    app = WizardApp(form)
+    async with app.run_test(size=(80, 30)) as pilot:
+        app.query_one("#first").value = "hello"
+        await press(pilot, "#next")
+        assert form.fields["first"].widget is None
+        assert not app.query("#first")
+        assert form.get_data()["first"] == "hello"
+        await press(pilot, "#back")
+        assert app.query_one("#first").value == "hello"